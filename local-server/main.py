@@ -1,29 +1,296 @@
 #!/usr/bin/env python3
+import asyncio
+import base64
+import bisect
+import functools
+import inspect
 import os
+import re
 import json
+import operator
+import statistics
+import time
+from collections import Counter, OrderedDict
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional, List
+from typing import Optional, List, Union
 import httpx
+import orjson
 from fastmcp import FastMCP
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# Content-Type for request bodies pre-serialized with orjson
+_JSON_HEADERS = {"Content-Type": "application/json"}
+# Query strings for the drafts/posts listings, indexed by limit (API max 25)
+_LIMIT_QS = tuple(f"?limit={i}" for i in range(26))
+# Conversation actions reported by create_post: (payload key, label, label takes a count)
+_POST_ACTIONS = (
+    ("close", "closed conversation", False),
+    ("reopen", "reopened conversation", False),
+    ("add_to_inbox", "moved to inbox", False),
+    ("add_shared_labels", "added {n} label(s)", True),
+    ("remove_shared_labels", "removed {n} label(s)", True),
+    ("add_assignees", "assigned {n} user(s)", True),
+    ("remove_assignees", "unassigned {n} user(s)", True),
+)
+# Section divider for get_analytics_report output
+_ANALYTICS_HR = "═" * 40 + "\n"
+
+# Per-message block for search_messages_by_email_id
+_MESSAGE_SEARCH_TEMPLATE = (
+    "{i}. {subject}\n"
+    "{from_line}"
+    "{to_line}"
+    "{preview_line}"
+    "{delivered_line}"
+    "   Type: {type}\n"
+    "   Message ID: {id}\n\n"
+).format_map
+
+# Per-contact block for list_contacts and get_contacts_by_group
+_CONTACT_TEMPLATE = (
+    "{i}. {name}\n"
+    "{email_line}"
+    "{phone_line}"
+    "{org_line}"
+    "{group_line}"
+    "   ID: {id}\n\n"
+).format_map
+
+# Shared defaults for missing nested objects and lists in .get() chains
+# (never mutated)
+_EMPTY = {}
+_EMPTY_LIST = ()
+
+# Matches HTML tags when cleaning message bodies for display
+_TAG_RE = re.compile('<[^<]+?>')
+
+class MissiveError(httpx.HTTPStatusError):
+    """Error response (4xx/5xx) from the Missive API"""
+
+async def raise_for_missive_error(response: httpx.Response):
+    """Response hook for the shared client: raise MissiveError on error statuses"""
+    if response.is_error:
+        await response.aread()
+        raise MissiveError(
+            f"HTTP {response.status_code} for {response.request.url}",
+            request=response.request,
+            response=response
+        )
+
+# Error messages shared by every tool, keyed by HTTP status
+_API_ERRORS = {401: "Invalid Missive API token."}
+
+def format_api_error(e: httpx.HTTPStatusError, action: str, messages: Optional[dict] = None) -> str:
+    """Map an API error response to a tool error string, adding the body to 400 errors"""
+    status = e.response.status_code
+    message = _API_ERRORS.get(status) or (messages or {}).get(status)
+    if message is None:
+        return f"Error {action}: HTTP {status}"
+    if status == 400:
+        try:
+            message += f" - {e.response.json()}"
+        except ValueError:
+            pass
+    return f"Error: {message}"
+
+def api_errors(action: str, messages: Optional[dict] = None):
+    """Turn API errors raised by a tool into its error string.
+
+    `messages` maps HTTP statuses to templates formatted with the tool's
+    arguments, e.g. {404: "Contact {contact_id} not found"}.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except MissiveError as e:
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                return format_api_error(e, action, {
+                    status: template.format_map(bound.arguments)
+                    for status, template in (messages or {}).items()
+                })
+            except Exception as e:
+                return f"Error {action}: {str(e)}"
+        return wrapper
+    return decorator
+
+# Transient failures retried by the shared client: 429 for any request (the
+# request was not processed), gateway errors and connection errors only for
+# idempotent methods
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+_RETRY_ATTEMPTS = 3
+_RETRY_BACKOFF = 0.5
+_RETRY_AFTER_MAX = 10.0
+
+class RetryTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that retries transient failures with exponential backoff"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        idempotent = request.method in _IDEMPOTENT_METHODS
+        for attempt in range(_RETRY_ATTEMPTS):
+            delay = _RETRY_BACKOFF * 2 ** attempt
+            final = attempt == _RETRY_ATTEMPTS - 1
+            try:
+                response = await self._transport.handle_async_request(request)
+            except httpx.TransportError:
+                if final or not idempotent:
+                    raise
+            else:
+                status = response.status_code
+                if final or not (status == 429 or (idempotent and status in _RETRY_STATUSES)):
+                    return response
+                retry_after = response.headers.get("Retry-After", "")
+                if retry_after.isdigit():
+                    delay = min(float(retry_after), _RETRY_AFTER_MAX)
+                await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+# Shared HTTP client, created lazily so tool calls reuse one HTTP/2
+# connection to the Missive API instead of opening a new one each time
+_client: Optional[httpx.AsyncClient] = None
+
+def get_client():
+    """Get the shared HTTP client, authenticated with the API token"""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url="https://public.missiveapp.com",
+            headers={"Authorization": f"Bearer {get_api_token()}"},
+            transport=RetryTransport(httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60.0)
+            )),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            event_hooks={"response": [raise_for_missive_error]}
+        )
+    return _client
+
+async def close_client():
+    """Close the shared HTTP client"""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+@asynccontextmanager
+async def lifespan(server):
+    """Close the shared HTTP client when the server shuts down"""
+    try:
+        yield
+    finally:
+        await close_client()
+
 # Initialize FastMCP server for local stdio use
-mcp = FastMCP("Missive MCP")
+mcp = FastMCP("Missive MCP", lifespan=lifespan)
 
 # Helper function to get API token
+@functools.lru_cache(maxsize=1)
 def get_api_token():
-    """Get API token from environment variable"""
+    """Get API token from environment variable (read once and cached for the life of the process)"""
     api_token = os.getenv("MISSIVE_API_TOKEN")
     if not api_token:
         raise ValueError("MISSIVE_API_TOKEN not set in environment")
     return api_token
 
+# Month abbreviations for report dates (avoids strftime format parsing)
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun",
+           "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
 # Helper function to format timestamp
 def format_timestamp(timestamp):
     """Convert Unix timestamp to readable date"""
     if timestamp:
-        return datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+        dt = datetime.fromtimestamp(timestamp)
+        return f"{dt.year}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
     return "Not set"
 
+# Helper function to format a report date
+def format_date(dt):
+    """Format a datetime as e.g. '05 Jan 2026'"""
+    return f"{dt.day:02d} {_MONTHS[dt.month - 1]} {dt.year}"
+
+# Helper function to shorten long text for display
+def truncate(text: str, limit: int) -> str:
+    """Cut text to `limit` characters, marking the cut with '...'"""
+    return text if len(text) <= limit else f"{text[:limit]}..."
+
+# Helper functions to format email address fields
+def format_address(field):
+    """Format a single from/to field as 'Name <address>'"""
+    return f"{field.get('name', 'Unknown')} <{field.get('address', 'unknown')}>"
+
+def format_addresses(fields):
+    """Format a list of from/to fields as a comma-separated string"""
+    return ", ".join(f"{f.get('name', 'Unknown')} <{f.get('address', 'unknown')}>" for f in fields)
+
+async def fetch_list_items(path: str, key: str, fields: tuple, max_chars: Optional[int] = None) -> list:
+    """Fetch the `key` list from a GET endpoint, keeping only `fields` of each item.
+
+    With ijson installed the body is parsed incrementally, so only one full item
+    is held at a time and string fields are cut to `max_chars`.
+    """
+    client = get_client()
+    if ijson is None:
+        response = await client.get(path)
+        return orjson.loads(response.content).get(key, [])
+
+    items = []
+    parsed = ijson.sendable_list()
+    parser = ijson.items_coro(parsed, f"{key}.item", use_float=True)
+    async with client.stream("GET", path) as response:
+        async for chunk in response.aiter_bytes():
+            parser.send(chunk)
+            for item in parsed:
+                items.append({
+                    field: value[:max_chars] if max_chars and isinstance(value, str) else value
+                    for field, value in item.items() if field in fields
+                })
+            del parsed[:]
+    parser.close()
+    return items
+
+# Short-lived cache of read tool output, keyed by tool name and arguments
+_READ_CACHE_TTL = 5.0
+_READ_CACHE_SIZE = 256
+_read_cache: OrderedDict = OrderedDict()
+
+def ttl_cache(ttl: float):
+    """Cache a read tool's successful output for `ttl` seconds (LRU-bounded)"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            cached = _read_cache.get(key)
+            if cached and now - cached[0] < ttl:
+                _read_cache.move_to_end(key)
+                return cached[1]
+            result = await func(*args, **kwargs)
+            if not result.startswith("Error"):
+                _read_cache[key] = (now, result)
+                _read_cache.move_to_end(key)
+                if len(_read_cache) > _READ_CACHE_SIZE:
+                    _read_cache.popitem(last=False)
+            return result
+        return wrapper
+    return decorator
+
 # ============================================================================
 # CONVERSATION ENDPOINTS
 # ============================================================================
@@ -33,39 +300,38 @@ async def get_conversations() -> str:
     """Get recent conversations from Missive inbox"""
     
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "https://public.missiveapp.com/v1/conversations",
-                headers={"Authorization": f"Bearer {api_token}"},
-                params={"inbox": "true", "limit": 10}
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            conversations = data.get("conversations", [])
-            if not conversations:
-                return "No conversations found in your Missive inbox"
-            
-            result = "📧 Recent Missive Conversations:\n\n"
-            for conv in conversations[:5]:
-                subject = conv.get("latest_message_subject", "No subject")
-                authors = ", ".join([a.get("name", "Unknown") for a in conv.get("authors", [])])
-                result += f"• {subject}\n  From: {authors}\n\n"
-            
-            return result
-            
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
-            else:
-                return f"Error fetching conversations: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error fetching conversations: {str(e)}"
+    client = get_client()
+    try:
+        response = await client.get(
+            "/v1/conversations",
+            params={"inbox": "true", "limit": 10}
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        conversations = data.get("conversations", [])
+        if not conversations:
+            return "No conversations found in your Missive inbox"
+        
+        result = "📧 Recent Missive Conversations:\n\n"
+        for conv in conversations[:5]:
+            subject = conv.get("latest_message_subject", "No subject")
+            authors = ", ".join([a.get("name", "Unknown") for a in conv.get("authors", [])])
+            result += f"• {subject}\n  From: {authors}\n\n"
+        
+        return result
+        
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
+        else:
+            return f"Error fetching conversations: HTTP {e.response.status_code}"
+    except Exception as e:
+        return f"Error fetching conversations: {str(e)}"
 
 @mcp.tool
 async def get_conversations_filtered(
@@ -82,7 +348,7 @@ async def get_conversations_filtered(
     """
     
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
     
@@ -116,44 +382,43 @@ async def get_conversations_filtered(
         elif mailbox == "all":
             params = {"team_all": team_id, "limit": min(limit, 50)}
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "https://public.missiveapp.com/v1/conversations",
-                headers={"Authorization": f"Bearer {api_token}"},
-                params=params
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            conversations = data.get("conversations", [])
-            if not conversations:
-                return f"No conversations found in {mailbox} mailbox"
-            
-            result = f"📧 Conversations from {mailbox.title()} ({len(conversations)} found):\n\n"
-            for conv in conversations:
-                subject = conv.get("latest_message_subject", "No subject")
-                authors = ", ".join([a.get("name", "Unknown") for a in conv.get("authors", [])])
-                assignees = conv.get("assignee_names", "Unassigned")
-                tasks_count = conv.get("tasks_count", 0)
-                
-                result += f"• {subject}\n"
-                result += f"  From: {authors}\n"
-                if assignees:
-                    result += f"  Assigned: {assignees}\n"
-                if tasks_count > 0:
-                    result += f"  Tasks: {tasks_count}\n"
-                result += f"  ID: {conv.get('id')}\n\n"
-            
-            return result
-            
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
-            else:
-                return f"Error fetching conversations: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error fetching conversations: {str(e)}"
+    client = get_client()
+    try:
+        response = await client.get(
+            "/v1/conversations",
+            params=params
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        conversations = data.get("conversations", [])
+        if not conversations:
+            return f"No conversations found in {mailbox} mailbox"
+        
+        result = f"📧 Conversations from {mailbox.title()} ({len(conversations)} found):\n\n"
+        for conv in conversations:
+            subject = conv.get("latest_message_subject", "No subject")
+            authors = ", ".join([a.get("name", "Unknown") for a in conv.get("authors", [])])
+            assignees = conv.get("assignee_names", "Unassigned")
+            tasks_count = conv.get("tasks_count", 0)
+            
+            result += f"• {subject}\n"
+            result += f"  From: {authors}\n"
+            if assignees:
+                result += f"  Assigned: {assignees}\n"
+            if tasks_count > 0:
+                result += f"  Tasks: {tasks_count}\n"
+            result += f"  ID: {conv.get('id')}\n\n"
+        
+        return result
+        
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
+        else:
+            return f"Error fetching conversations: HTTP {e.response.status_code}"
+    except Exception as e:
+        return f"Error fetching conversations: {str(e)}"
 
 @mcp.tool
 async def get_conversation_details(conversation_id: str) -> str:
@@ -164,95 +429,92 @@ async def get_conversation_details(conversation_id: str) -> str:
     """
     
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"https://public.missiveapp.com/v1/conversations/{conversation_id}",
-                headers={"Authorization": f"Bearer {api_token}"}
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            conversations = data.get("conversations", [])
-            if not conversations:
-                return f"Conversation {conversation_id} not found"
-            
-            conv = conversations[0]
-            
-            result = f"📧 Conversation Details:\n\n"
-            result += f"Subject: {conv.get('latest_message_subject', 'No subject')}\n"
-            result += f"ID: {conv.get('id')}\n"
-            
-            # Authors
-            authors = conv.get("authors", [])
-            if authors:
-                result += f"Authors: {', '.join([a.get('name', 'Unknown') for a in authors])}\n"
-            
-            # Assignees
-            assignees = conv.get("assignee_names", "")
-            if assignees:
-                result += f"Assigned to: {assignees}\n"
-            
-            # Team
-            team = conv.get("team")
-            if team:
-                result += f"Team: {team.get('name')}\n"
-            
-            # Organization
-            org = conv.get("organization")
-            if org:
-                result += f"Organization: {org.get('name')}\n"
-            
-            # Counts
-            result += f"Messages: {conv.get('messages_count', 0)}\n"
-            result += f"Tasks: {conv.get('tasks_count', 0)} ({conv.get('completed_tasks_count', 0)} completed)\n"
-            result += f"Attachments: {conv.get('attachments_count', 0)}\n"
-            result += f"Drafts: {conv.get('drafts_count', 0)}\n"
-            
-            # Status
-            users = conv.get("users", [])
-            if users:
-                user = users[0]
-                status = []
-                if user.get("assigned"): status.append("assigned")
-                if user.get("closed"): status.append("closed")
-                if user.get("archived"): status.append("archived")
-                if user.get("flagged"): status.append("flagged")
-                if user.get("snoozed"): status.append("snoozed")
-                if user.get("trashed"): status.append("trashed")
-                if user.get("junked"): status.append("junked")
-                
-                if status:
-                    result += f"Status: {', '.join(status)}\n"
-            
-            # Shared labels
-            shared_labels = conv.get("shared_label_names", "")
-            if shared_labels:
-                result += f"Labels: {shared_labels}\n"
-            
-            # Last activity
-            last_activity = conv.get("last_activity_at")
-            if last_activity:
-                result += f"Last activity: {format_timestamp(last_activity)}\n"
-            
-            # URLs
-            result += f"\nWeb URL: {conv.get('web_url', 'N/A')}\n"
-            
-            return result
-            
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
-            elif e.response.status_code == 404:
-                return f"Error: Conversation {conversation_id} not found"
-            else:
-                return f"Error fetching conversation: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error fetching conversation: {str(e)}"
+    client = get_client()
+    try:
+        response = await client.get(f"/v1/conversations/{conversation_id}")
+        response.raise_for_status()
+        data = response.json()
+        
+        conversations = data.get("conversations", [])
+        if not conversations:
+            return f"Conversation {conversation_id} not found"
+        
+        conv = conversations[0]
+        
+        result = f"📧 Conversation Details:\n\n"
+        result += f"Subject: {conv.get('latest_message_subject', 'No subject')}\n"
+        result += f"ID: {conv.get('id')}\n"
+        
+        # Authors
+        authors = conv.get("authors", [])
+        if authors:
+            result += f"Authors: {', '.join([a.get('name', 'Unknown') for a in authors])}\n"
+        
+        # Assignees
+        assignees = conv.get("assignee_names", "")
+        if assignees:
+            result += f"Assigned to: {assignees}\n"
+        
+        # Team
+        team = conv.get("team")
+        if team:
+            result += f"Team: {team.get('name')}\n"
+        
+        # Organization
+        org = conv.get("organization")
+        if org:
+            result += f"Organization: {org.get('name')}\n"
+        
+        # Counts
+        result += f"Messages: {conv.get('messages_count', 0)}\n"
+        result += f"Tasks: {conv.get('tasks_count', 0)} ({conv.get('completed_tasks_count', 0)} completed)\n"
+        result += f"Attachments: {conv.get('attachments_count', 0)}\n"
+        result += f"Drafts: {conv.get('drafts_count', 0)}\n"
+        
+        # Status
+        users = conv.get("users", [])
+        if users:
+            user = users[0]
+            status = []
+            if user.get("assigned"): status.append("assigned")
+            if user.get("closed"): status.append("closed")
+            if user.get("archived"): status.append("archived")
+            if user.get("flagged"): status.append("flagged")
+            if user.get("snoozed"): status.append("snoozed")
+            if user.get("trashed"): status.append("trashed")
+            if user.get("junked"): status.append("junked")
+            
+            if status:
+                result += f"Status: {', '.join(status)}\n"
+        
+        # Shared labels
+        shared_labels = conv.get("shared_label_names", "")
+        if shared_labels:
+            result += f"Labels: {shared_labels}\n"
+        
+        # Last activity
+        last_activity = conv.get("last_activity_at")
+        if last_activity:
+            result += f"Last activity: {format_timestamp(last_activity)}\n"
+        
+        # URLs
+        result += f"\nWeb URL: {conv.get('web_url', 'N/A')}\n"
+        
+        return result
+        
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
+        elif e.response.status_code == 404:
+            return f"Error: Conversation {conversation_id} not found"
+        else:
+            return f"Error fetching conversation: HTTP {e.response.status_code}"
+    except Exception as e:
+        return f"Error fetching conversation: {str(e)}"
 
 @mcp.tool
 async def get_conversation_messages(conversation_id: str, limit: int = 5) -> str:
@@ -264,68 +526,66 @@ async def get_conversation_messages(conversation_id: str, limit: int = 5) -> str
     """
     
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"https://public.missiveapp.com/v1/conversations/{conversation_id}/messages",
-                headers={"Authorization": f"Bearer {api_token}"},
-                params={"limit": min(limit, 10)}
-            )
-            response.raise_for_status()
-            data = response.json()
+    client = get_client()
+    try:
+        response = await client.get(
+            f"/v1/conversations/{conversation_id}/messages",
+            params={"limit": min(limit, 10)}
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        messages = data.get("messages", [])
+        if not messages:
+            return f"No messages found in conversation {conversation_id}"
+        
+        result = f"💬 Messages in Conversation ({len(messages)} found):\n\n"
+        
+        for i, msg in enumerate(messages, 1):
+            result += f"{i}. {msg.get('subject', 'No subject')}\n"
             
-            messages = data.get("messages", [])
-            if not messages:
-                return f"No messages found in conversation {conversation_id}"
+            # From field
+            from_field = msg.get("from_field", {})
+            if from_field:
+                result += f"   From: {format_address(from_field)}\n"
             
-            result = f"💬 Messages in Conversation ({len(messages)} found):\n\n"
+            # To fields
+            to_fields = msg.get("to_fields", [])
+            if to_fields:
+                result += f"   To: {format_addresses(to_fields)}\n"
             
-            for i, msg in enumerate(messages, 1):
-                result += f"{i}. {msg.get('subject', 'No subject')}\n"
-                
-                # From field
-                from_field = msg.get("from_field", {})
-                if from_field:
-                    result += f"   From: {from_field.get('name', 'Unknown')} <{from_field.get('address', 'unknown')}>\n"
-                
-                # To fields
-                to_fields = msg.get("to_fields", [])
-                if to_fields:
-                    to_names = [f"{t.get('name', 'Unknown')} <{t.get('address', 'unknown')}>" for t in to_fields]
-                    result += f"   To: {', '.join(to_names)}\n"
-                
-                # Preview
-                preview = msg.get("preview", "")
-                if preview:
-                    result += f"   Preview: {preview[:100]}{'...' if len(preview) > 100 else ''}\n"
-                
-                # Delivered time
-                delivered_at = msg.get("delivered_at")
-                if delivered_at:
-                    result += f"   Delivered: {format_timestamp(delivered_at)}\n"
-                
-                # Attachments
-                attachments = msg.get("attachments", [])
-                if attachments:
-                    result += f"   Attachments: {len(attachments)} file(s)\n"
-                
-                result += f"   Message ID: {msg.get('id')}\n\n"
+            # Preview
+            preview = msg.get("preview", "")
+            if preview:
+                result += f"   Preview: {truncate(preview, 100)}\n"
             
-            return result
+            # Delivered time
+            delivered_at = msg.get("delivered_at")
+            if delivered_at:
+                result += f"   Delivered: {format_timestamp(delivered_at)}\n"
             
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
-            elif e.response.status_code == 404:
-                return f"Error: Conversation {conversation_id} not found"
-            else:
-                return f"Error fetching messages: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error fetching messages: {str(e)}"
+            # Attachments
+            attachments = msg.get("attachments", [])
+            if attachments:
+                result += f"   Attachments: {len(attachments)} file(s)\n"
+            
+            result += f"   Message ID: {msg.get('id')}\n\n"
+        
+        return result
+        
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
+        elif e.response.status_code == 404:
+            return f"Error: Conversation {conversation_id} not found"
+        else:
+            return f"Error fetching messages: HTTP {e.response.status_code}"
+    except Exception as e:
+        return f"Error fetching messages: {str(e)}"
 
 @mcp.tool
 async def get_conversation_comments(conversation_id: str, limit: int = 5) -> str:
@@ -337,72 +597,71 @@ async def get_conversation_comments(conversation_id: str, limit: int = 5) -> str
     """
     
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"https://public.missiveapp.com/v1/conversations/{conversation_id}/comments",
-                headers={"Authorization": f"Bearer {api_token}"},
-                params={"limit": min(limit, 10)}
-            )
-            response.raise_for_status()
-            data = response.json()
+    client = get_client()
+    try:
+        response = await client.get(
+            f"/v1/conversations/{conversation_id}/comments",
+            params={"limit": min(limit, 10)}
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        comments = data.get("comments", [])
+        if not comments:
+            return f"No comments found in conversation {conversation_id}"
+        
+        result = f"💭 Comments in Conversation ({len(comments)} found):\n\n"
+        
+        for i, comment in enumerate(comments, 1):
+            result += f"{i}. {comment.get('body', 'No content')}\n"
             
-            comments = data.get("comments", [])
-            if not comments:
-                return f"No comments found in conversation {conversation_id}"
+            # Author
+            author = comment.get("author", {})
+            if author:
+                result += f"   By: {author.get('name', 'Unknown')} <{author.get('email', 'unknown')}>\n"
             
-            result = f"💭 Comments in Conversation ({len(comments)} found):\n\n"
+            # Created time
+            created_at = comment.get("created_at")
+            if created_at:
+                result += f"   Created: {format_timestamp(created_at)}\n"
             
-            for i, comment in enumerate(comments, 1):
-                result += f"{i}. {comment.get('body', 'No content')}\n"
-                
-                # Author
-                author = comment.get("author", {})
-                if author:
-                    result += f"   By: {author.get('name', 'Unknown')} <{author.get('email', 'unknown')}>\n"
-                
-                # Created time
-                created_at = comment.get("created_at")
-                if created_at:
-                    result += f"   Created: {format_timestamp(created_at)}\n"
-                
-                # Task info
-                task = comment.get("task")
-                if task:
-                    result += f"   Task: {task.get('description', 'No description')}\n"
-                    result += f"   Task State: {task.get('state', 'unknown')}\n"
-                    
-                    due_at = task.get("due_at")
-                    if due_at:
-                        result += f"   Due: {format_timestamp(due_at)}\n"
-                    
-                    assignees = task.get("assignees", [])
-                    if assignees:
-                        assignee_names = [a.get('name', 'Unknown') for a in assignees]
-                        result += f"   Assigned to: {', '.join(assignee_names)}\n"
+            # Task info
+            task = comment.get("task")
+            if task:
+                result += f"   Task: {task.get('description', 'No description')}\n"
+                result += f"   Task State: {task.get('state', 'unknown')}\n"
                 
-                # Attachment
-                attachment = comment.get("attachment")
-                if attachment:
-                    result += f"   Attachment: {attachment.get('filename', 'Unknown file')}\n"
+                due_at = task.get("due_at")
+                if due_at:
+                    result += f"   Due: {format_timestamp(due_at)}\n"
                 
-                result += f"   Comment ID: {comment.get('id')}\n\n"
+                assignees = task.get("assignees", [])
+                if assignees:
+                    assignee_names = [a.get('name', 'Unknown') for a in assignees]
+                    result += f"   Assigned to: {', '.join(assignee_names)}\n"
             
-            return result
+            # Attachment
+            attachment = comment.get("attachment")
+            if attachment:
+                result += f"   Attachment: {attachment.get('filename', 'Unknown file')}\n"
             
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
-            elif e.response.status_code == 404:
-                return f"Error: Conversation {conversation_id} not found"
-            else:
-                return f"Error fetching comments: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error fetching comments: {str(e)}"
+            result += f"   Comment ID: {comment.get('id')}\n\n"
+        
+        return result
+        
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
+        elif e.response.status_code == 404:
+            return f"Error: Conversation {conversation_id} not found"
+        else:
+            return f"Error fetching comments: HTTP {e.response.status_code}"
+    except Exception as e:
+        return f"Error fetching comments: {str(e)}"
 
 # ============================================================================
 # TASK ENDPOINTS
@@ -433,7 +692,7 @@ async def create_task(
     """
     
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
     
@@ -468,58 +727,54 @@ async def create_task(
     
     payload = {"tasks": task_data}
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                "https://public.missiveapp.com/v1/tasks",
-                headers={
-                    "Authorization": f"Bearer {api_token}",
-                    "Content-Type": "application/json"
-                },
-                json=payload
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            task = data.get("tasks", {})
-            
-            result = f"✅ Task Created Successfully!\n\n"
-            result += f"Title: {task.get('title', 'Unknown')}\n"
-            result += f"Description: {task.get('description', 'No description')}\n"
-            result += f"State: {task.get('state', 'unknown')}\n"
-            result += f"Task ID: {task.get('id')}\n"
-            
-            # Due date
-            due_at = task.get("due_at")
-            if due_at:
-                result += f"Due: {format_timestamp(due_at)}\n"
-            
-            # Assignees
-            assignees = task.get("assignees", [])
-            if assignees:
-                result += f"Assignees: {', '.join(assignees)}\n"
-            
-            # Team
-            team = task.get("team")
-            if team:
-                result += f"Team: {team}\n"
-            
-            # Conversation (for subtasks)
-            conversation = task.get("conversation")
-            if conversation:
-                result += f"Conversation: {conversation}\n"
-            
-            return result
-            
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
-            elif e.response.status_code == 400:
-                return f"Error: Invalid task data. Please check your parameters."
-            else:
-                return f"Error creating task: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error creating task: {str(e)}"
+    client = get_client()
+    try:
+        response = await client.post(
+            "/v1/tasks",
+            json=payload
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        task = data.get("tasks", {})
+        
+        result = f"✅ Task Created Successfully!\n\n"
+        result += f"Title: {task.get('title', 'Unknown')}\n"
+        result += f"Description: {task.get('description', 'No description')}\n"
+        result += f"State: {task.get('state', 'unknown')}\n"
+        result += f"Task ID: {task.get('id')}\n"
+        
+        # Due date
+        due_at = task.get("due_at")
+        if due_at:
+            result += f"Due: {format_timestamp(due_at)}\n"
+        
+        # Assignees
+        assignees = task.get("assignees", [])
+        if assignees:
+            result += f"Assignees: {', '.join(assignees)}\n"
+        
+        # Team
+        team = task.get("team")
+        if team:
+            result += f"Team: {team}\n"
+        
+        # Conversation (for subtasks)
+        conversation = task.get("conversation")
+        if conversation:
+            result += f"Conversation: {conversation}\n"
+        
+        return result
+        
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
+        elif e.response.status_code == 400:
+            return f"Error: Invalid task data. Please check your parameters."
+        else:
+            return f"Error creating task: HTTP {e.response.status_code}"
+    except Exception as e:
+        return f"Error creating task: {str(e)}"
 
 @mcp.tool
 async def update_task(
@@ -544,7 +799,7 @@ async def update_task(
     """
     
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
     
@@ -576,55 +831,51 @@ async def update_task(
     
     payload = {"tasks": task_data}
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.patch(
-                f"https://public.missiveapp.com/v1/tasks/{task_id}",
-                headers={
-                    "Authorization": f"Bearer {api_token}",
-                    "Content-Type": "application/json"
-                },
-                json=payload
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            task = data.get("tasks", {})
-            
-            result = f"✅ Task Updated Successfully!\n\n"
-            result += f"Title: {task.get('title', 'Unknown')}\n"
-            result += f"Description: {task.get('description', 'No description')}\n"
-            result += f"State: {task.get('state', 'unknown')}\n"
-            result += f"Task ID: {task.get('id')}\n"
-            
-            # Due date
-            due_at = task.get("due_at")
-            if due_at:
-                result += f"Due: {format_timestamp(due_at)}\n"
-            
-            # Assignees
-            assignees = task.get("assignees", [])
-            if assignees:
-                result += f"Assignees: {', '.join(assignees)}\n"
-            
-            # Team
-            team = task.get("team")
-            if team:
-                result += f"Team: {team}\n"
-            
-            return result
-            
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
-            elif e.response.status_code == 404:
-                return f"Error: Task {task_id} not found"
-            elif e.response.status_code == 400:
-                return f"Error: Invalid task data. Please check your parameters."
-            else:
-                return f"Error updating task: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error updating task: {str(e)}"
+    client = get_client()
+    try:
+        response = await client.patch(
+            f"/v1/tasks/{task_id}",
+            json=payload
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        task = data.get("tasks", {})
+        
+        result = f"✅ Task Updated Successfully!\n\n"
+        result += f"Title: {task.get('title', 'Unknown')}\n"
+        result += f"Description: {task.get('description', 'No description')}\n"
+        result += f"State: {task.get('state', 'unknown')}\n"
+        result += f"Task ID: {task.get('id')}\n"
+        
+        # Due date
+        due_at = task.get("due_at")
+        if due_at:
+            result += f"Due: {format_timestamp(due_at)}\n"
+        
+        # Assignees
+        assignees = task.get("assignees", [])
+        if assignees:
+            result += f"Assignees: {', '.join(assignees)}\n"
+        
+        # Team
+        team = task.get("team")
+        if team:
+            result += f"Team: {team}\n"
+        
+        return result
+        
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
+        elif e.response.status_code == 404:
+            return f"Error: Task {task_id} not found"
+        elif e.response.status_code == 400:
+            return f"Error: Invalid task data. Please check your parameters."
+        else:
+            return f"Error updating task: HTTP {e.response.status_code}"
+    except Exception as e:
+        return f"Error updating task: {str(e)}"
 
 # ============================================================================
 # MESSAGE ENDPOINTS
@@ -638,105 +889,126 @@ async def get_message_details(message_id: str) -> str:
         message_id: The ID of the message to retrieve
     """
     
+    return await fetch_message_details(message_id)
+
+@mcp.tool
+async def get_message_details_batch(message_ids: List[str]) -> str:
+    """Get full details of several messages at once.
+    
+    The messages are fetched concurrently over the shared connection, so this
+    is faster than calling get_message_details once per message.
+    
+    Args:
+        message_ids: List of message IDs to retrieve (max 10)
+    """
+    
+    if not message_ids:
+        return "Error: At least one message ID is required"
+    if len(message_ids) > 10:
+        return "Error: At most 10 message IDs per call"
+    
+    results = await asyncio.gather(
+        *(fetch_message_details(message_id) for message_id in message_ids)
+    )
+    
+    return "\n".join(results)
+
+async def fetch_message_details(message_id: str) -> str:
+    """Fetch and format a single message for the message details tools"""
+    
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"https://public.missiveapp.com/v1/messages/{message_id}",
-                headers={"Authorization": f"Bearer {api_token}"}
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            message = data.get("messages", {})
-            if not message:
-                return f"Message {message_id} not found"
-            
-            result = f"📨 Message Details:\n\n"
-            result += f"Subject: {message.get('subject', 'No subject')}\n"
-            result += f"Type: {message.get('type', 'unknown')}\n"
-            result += f"Message ID: {message.get('id')}\n"
-            
-            # From field
-            from_field = message.get("from_field", {})
-            if from_field:
-                result += f"From: {from_field.get('name', 'Unknown')} <{from_field.get('address', 'unknown')}>\n"
-            
-            # To fields
-            to_fields = message.get("to_fields", [])
-            if to_fields:
-                to_names = [f"{t.get('name', 'Unknown')} <{t.get('address', 'unknown')}>" for t in to_fields]
-                result += f"To: {', '.join(to_names)}\n"
-            
-            # CC fields
-            cc_fields = message.get("cc_fields", [])
-            if cc_fields:
-                cc_names = [f"{c.get('name', 'Unknown')} <{c.get('address', 'unknown')}>" for c in cc_fields]
-                result += f"CC: {', '.join(cc_names)}\n"
-            
-            # Timestamps
-            delivered_at = message.get("delivered_at")
-            if delivered_at:
-                result += f"Delivered: {format_timestamp(delivered_at)}\n"
-            
-            created_at = message.get("created_at")
-            if created_at:
-                result += f"Created: {format_timestamp(created_at)}\n"
-            
-            # Preview
-            preview = message.get("preview", "")
-            if preview:
-                result += f"Preview: {preview}\n"
-            
-            # Body (truncated for display)
-            body = message.get("body", "")
-            if body:
-                # Remove HTML tags for cleaner display
-                import re
-                clean_body = re.sub('<[^<]+?>', '', body)
-                result += f"Body: {clean_body[:500]}{'...' if len(clean_body) > 500 else ''}\n"
-            
-            # Attachments
-            attachments = message.get("attachments", [])
-            if attachments:
-                result += f"\nAttachments ({len(attachments)}):\n"
-                for att in attachments:
-                    result += f"  • {att.get('filename', 'Unknown')} ({att.get('size', 0)} bytes)\n"
-                    result += f"    Type: {att.get('media_type', 'unknown')}/{att.get('sub_type', 'unknown')}\n"
-                    if att.get('width') and att.get('height'):
-                        result += f"    Dimensions: {att.get('width')}x{att.get('height')}\n"
-            
-            # Conversation info
-            conversation = message.get("conversation", {})
-            if conversation:
-                result += f"\nConversation: {conversation.get('latest_message_subject', 'No subject')}\n"
-                result += f"Conversation ID: {conversation.get('id')}\n"
-                
-                # Team
-                team = conversation.get("team", {})
-                if team:
-                    result += f"Team: {team.get('name')}\n"
-                
-                # Organization
-                org = conversation.get("organization", {})
-                if org:
-                    result += f"Organization: {org.get('name')}\n"
+    client = get_client()
+    try:
+        response = await client.get(f"/v1/messages/{message_id}")
+        response.raise_for_status()
+        data = response.json()
+        
+        message = data.get("messages", {})
+        if not message:
+            return f"Message {message_id} not found"
+        
+        result = f"📨 Message Details:\n\n"
+        result += f"Subject: {message.get('subject', 'No subject')}\n"
+        result += f"Type: {message.get('type', 'unknown')}\n"
+        result += f"Message ID: {message.get('id')}\n"
+        
+        # From field
+        from_field = message.get("from_field", {})
+        if from_field:
+            result += f"From: {format_address(from_field)}\n"
+        
+        # To fields
+        to_fields = message.get("to_fields", [])
+        if to_fields:
+            result += f"To: {format_addresses(to_fields)}\n"
+        
+        # CC fields
+        cc_fields = message.get("cc_fields", [])
+        if cc_fields:
+            result += f"CC: {format_addresses(cc_fields)}\n"
+        
+        # Timestamps
+        delivered_at = message.get("delivered_at")
+        if delivered_at:
+            result += f"Delivered: {format_timestamp(delivered_at)}\n"
+        
+        created_at = message.get("created_at")
+        if created_at:
+            result += f"Created: {format_timestamp(created_at)}\n"
+        
+        # Preview
+        preview = message.get("preview", "")
+        if preview:
+            result += f"Preview: {preview}\n"
+        
+        # Body (truncated for display)
+        body = message.get("body", "")
+        if body:
+            # Remove HTML tags for cleaner display (plain-text bodies skip the regex)
+            clean_body = _TAG_RE.sub('', body) if '<' in body else body
+            result += f"Body: {truncate(clean_body, 500)}\n"
+        
+        # Attachments
+        attachments = message.get("attachments", [])
+        if attachments:
+            result += f"\nAttachments ({len(attachments)}):\n"
+            for att in attachments:
+                result += f"  • {att.get('filename', 'Unknown')} ({att.get('size', 0)} bytes)\n"
+                result += f"    Type: {att.get('media_type', 'unknown')}/{att.get('sub_type', 'unknown')}\n"
+                if att.get('width') and att.get('height'):
+                    result += f"    Dimensions: {att.get('width')}x{att.get('height')}\n"
+        
+        # Conversation info
+        conversation = message.get("conversation", {})
+        if conversation:
+            result += f"\nConversation: {conversation.get('latest_message_subject', 'No subject')}\n"
+            result += f"Conversation ID: {conversation.get('id')}\n"
             
-            return result
+            # Team
+            team = conversation.get("team", {})
+            if team:
+                result += f"Team: {team.get('name')}\n"
             
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
-            elif e.response.status_code == 404:
-                return f"Error: Message {message_id} not found"
-            else:
-                return f"Error fetching message: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error fetching message: {str(e)}"
+            # Organization
+            org = conversation.get("organization", {})
+            if org:
+                result += f"Organization: {org.get('name')}\n"
+        
+        return result
+        
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
+        elif e.response.status_code == 404:
+            return f"Error: Message {message_id} not found"
+        else:
+            return f"Error fetching message: HTTP {e.response.status_code}"
+    except Exception as e:
+        return f"Error fetching message: {str(e)}"
 
 @mcp.tool
 async def search_messages_by_email_id(email_message_id: str) -> str:
@@ -747,67 +1019,54 @@ async def search_messages_by_email_id(email_message_id: str) -> str:
     """
     
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "https://public.missiveapp.com/v1/messages",
-                headers={"Authorization": f"Bearer {api_token}"},
-                params={"email_message_id": email_message_id}
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            messages = data.get("messages", [])
-            if not messages:
-                return f"No messages found with email Message-ID: {email_message_id}"
-            
-            result = f"📧 Messages found for Message-ID '{email_message_id}' ({len(messages)} found):\n\n"
-            
-            for i, message in enumerate(messages, 1):
-                result += f"{i}. {message.get('subject', 'No subject')}\n"
-                
-                # From field
-                from_field = message.get("from_field", {})
-                if from_field:
-                    result += f"   From: {from_field.get('name', 'Unknown')} <{from_field.get('address', 'unknown')}>\n"
-                
-                # To fields
-                to_fields = message.get("to_fields", [])
-                if to_fields:
-                    to_names = [f"{t.get('name', 'Unknown')} <{t.get('address', 'unknown')}>" for t in to_fields]
-                    result += f"   To: {', '.join(to_names)}\n"
-                
-                # Preview
-                preview = message.get("preview", "")
-                if preview:
-                    result += f"   Preview: {preview[:100]}{'...' if len(preview) > 100 else ''}\n"
-                
-                # Delivered time
-                delivered_at = message.get("delivered_at")
-                if delivered_at:
-                    result += f"   Delivered: {format_timestamp(delivered_at)}\n"
-                
-                # Message type
-                msg_type = message.get("type", "unknown")
-                result += f"   Type: {msg_type}\n"
-                
-                result += f"   Message ID: {message.get('id')}\n\n"
-            
-            return result
+    client = get_client()
+    try:
+        response = await client.get(
+            "/v1/messages",
+            params={"email_message_id": email_message_id}
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        messages = data.get("messages", [])
+        if not messages:
+            return f"No messages found with email Message-ID: {email_message_id}"
+        
+        parts = [f"📧 Messages found for Message-ID '{email_message_id}' ({len(messages)} found):\n\n"]
+        
+        for i, message in enumerate(messages, 1):
+            from_field = message.get("from_field", {})
+            to_fields = message.get("to_fields", [])
+            preview = message.get("preview", "")
+            delivered_at = message.get("delivered_at")
             
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
-            elif e.response.status_code == 404:
-                return f"Error: No messages found with Message-ID: {email_message_id}"
-            else:
-                return f"Error searching messages: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error searching messages: {str(e)}"
+            # Optional lines are pre-rendered so the block is a single template fill
+            parts.append(_MESSAGE_SEARCH_TEMPLATE({
+                "i": i,
+                "subject": message.get("subject", "No subject"),
+                "from_line": f"   From: {format_address(from_field)}\n" if from_field else "",
+                "to_line": f"   To: {format_addresses(to_fields)}\n" if to_fields else "",
+                "preview_line": f"   Preview: {truncate(preview, 100)}\n" if preview else "",
+                "delivered_line": f"   Delivered: {format_timestamp(delivered_at)}\n" if delivered_at else "",
+                "type": message.get("type", "unknown"),
+                "id": message.get("id"),
+            }))
+        
+        return "".join(parts)
+        
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
+        elif e.response.status_code == 404:
+            return f"Error: No messages found with Message-ID: {email_message_id}"
+        else:
+            return f"Error searching messages: HTTP {e.response.status_code}"
+    except Exception as e:
+        return f"Error searching messages: {str(e)}"
 
 @mcp.tool
 async def create_custom_message(
@@ -830,7 +1089,7 @@ async def create_custom_message(
     """
     
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
     
@@ -857,53 +1116,48 @@ async def create_custom_message(
     
     payload = {"messages": message_data}
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                "https://public.missiveapp.com/v1/messages",
-                headers={
-                    "Authorization": f"Bearer {api_token}",
-                    "Content-Type": "application/json"
-                },
-                json=payload
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            message = data.get("messages", {})
-            
-            result = f"📨 Message Created Successfully!\n\n"
-            result += f"Subject: {message.get('subject', 'No subject')}\n"
-            result += f"Type: {message.get('type', 'unknown')}\n"
-            result += f"Message ID: {message.get('id')}\n"
-            
-            # From field
-            from_field = message.get("from_field", {})
-            if from_field:
-                result += f"From: {from_field.get('name', 'Unknown')} <{from_field.get('address', 'unknown')}>\n"
-            
-            # To fields
-            to_fields = message.get("to_fields", [])
-            if to_fields:
-                to_names = [f"{t.get('name', 'Unknown')} <{t.get('address', 'unknown')}>" for t in to_fields]
-                result += f"To: {', '.join(to_names)}\n"
-            
-            # Delivered time
-            delivered_at = message.get("delivered_at")
-            if delivered_at:
-                result += f"Delivered: {format_timestamp(delivered_at)}\n"
-            
-            return result
-            
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
-            elif e.response.status_code == 400:
-                return f"Error: Invalid message data. Please check your parameters."
-            else:
-                return f"Error creating message: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error creating message: {str(e)}"
+    client = get_client()
+    try:
+        response = await client.post(
+            "/v1/messages",
+            json=payload
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        message = data.get("messages", {})
+        
+        result = f"📨 Message Created Successfully!\n\n"
+        result += f"Subject: {message.get('subject', 'No subject')}\n"
+        result += f"Type: {message.get('type', 'unknown')}\n"
+        result += f"Message ID: {message.get('id')}\n"
+        
+        # From field
+        from_field = message.get("from_field", {})
+        if from_field:
+            result += f"From: {format_address(from_field)}\n"
+        
+        # To fields
+        to_fields = message.get("to_fields", [])
+        if to_fields:
+            result += f"To: {format_addresses(to_fields)}\n"
+        
+        # Delivered time
+        delivered_at = message.get("delivered_at")
+        if delivered_at:
+            result += f"Delivered: {format_timestamp(delivered_at)}\n"
+        
+        return result
+        
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
+        elif e.response.status_code == 400:
+            return f"Error: Invalid message data. Please check your parameters."
+        else:
+            return f"Error creating message: HTTP {e.response.status_code}"
+    except Exception as e:
+        return f"Error creating message: {str(e)}"
 
 # ============================================================================
 # USER ENDPOINTS
@@ -924,7 +1178,7 @@ async def get_users(
     """
     
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
     
@@ -937,64 +1191,69 @@ async def get_users(
     if organization_id:
         params["organization"] = organization_id
     
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "https://public.missiveapp.com/v1/users",
-                headers={"Authorization": f"Bearer {api_token}"},
-                params=params
-            )
-            response.raise_for_status()
-            data = response.json()
-            
-            users = data.get("users", [])
-            if not users:
-                org_filter = f" in organization {organization_id}" if organization_id else ""
-                return f"No users found{org_filter}"
-            
-            # Find the authenticated user
-            current_user = next((u for u in users if u.get("me")), None)
-            
-            result = f"👥 Users ({len(users)} found"
-            if organization_id:
-                result += f" in organization {organization_id}"
-            result += "):\n\n"
-            
-            # Show current user first if found
-            if current_user:
-                result += f"🔹 {current_user.get('name', 'Unknown')} (You)\n"
-                result += f"   Email: {current_user.get('email', 'No email')}\n"
-                result += f"   ID: {current_user.get('id')}\n"
-                if current_user.get('avatar_url'):
-                    result += f"   Avatar: {current_user.get('avatar_url')}\n"
-                result += "\n"
-            
-            # Show other users
-            other_users = [u for u in users if not u.get("me")]
-            for i, user in enumerate(other_users, 1):
-                result += f"{i}. {user.get('name', 'Unknown')}\n"
-                result += f"   Email: {user.get('email', 'No email')}\n"
-                result += f"   ID: {user.get('id')}\n"
-                if user.get('avatar_url'):
-                    result += f"   Avatar: {user.get('avatar_url')}\n"
-                result += "\n"
-            
-            # Add pagination info if applicable
-            if len(users) == limit:
-                result += f"📄 Showing {len(users)} users (offset: {offset})\n"
-                result += f"Use offset={offset + limit} to see more users.\n"
-            
-            return result
-            
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
-            elif e.response.status_code == 404:
-                return f"Error: Organization {organization_id} not found" if organization_id else "Error: Users endpoint not found"
+    client = get_client()
+    try:
+        response = await client.get(
+            "/v1/users",
+            params=params
+        )
+        response.raise_for_status()
+        data = response.json()
+        
+        users = data.get("users", [])
+        if not users:
+            org_filter = f" in organization {organization_id}" if organization_id else ""
+            return f"No users found{org_filter}"
+        
+        # Split out the authenticated user in a single pass
+        current_user = None
+        other_users = []
+        for user in users:
+            if user.get("me"):
+                if current_user is None:
+                    current_user = user
             else:
-                return f"Error fetching users: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error fetching users: {str(e)}"
+                other_users.append(user)
+        
+        result = f"👥 Users ({len(users)} found"
+        if organization_id:
+            result += f" in organization {organization_id}"
+        result += "):\n\n"
+        
+        # Show current user first if found
+        if current_user:
+            result += f"🔹 {current_user.get('name', 'Unknown')} (You)\n"
+            result += f"   Email: {current_user.get('email', 'No email')}\n"
+            result += f"   ID: {current_user.get('id')}\n"
+            if current_user.get('avatar_url'):
+                result += f"   Avatar: {current_user.get('avatar_url')}\n"
+            result += "\n"
+        
+        # Show other users
+        for i, user in enumerate(other_users, 1):
+            result += f"{i}. {user.get('name', 'Unknown')}\n"
+            result += f"   Email: {user.get('email', 'No email')}\n"
+            result += f"   ID: {user.get('id')}\n"
+            if user.get('avatar_url'):
+                result += f"   Avatar: {user.get('avatar_url')}\n"
+            result += "\n"
+        
+        # Add pagination info if applicable
+        if len(users) == limit:
+            result += f"📄 Showing {len(users)} users (offset: {offset})\n"
+            result += f"Use offset={offset + limit} to see more users.\n"
+        
+        return result
+        
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
+        elif e.response.status_code == 404:
+            return f"Error: Organization {organization_id} not found" if organization_id else "Error: Users endpoint not found"
+        else:
+            return f"Error fetching users: HTTP {e.response.status_code}"
+    except Exception as e:
+        return f"Error fetching users: {str(e)}"
 
 # ============================================================================
 # ANALYTICS ENDPOINTS
@@ -1028,7 +1287,7 @@ async def create_analytics_report(
     """
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
@@ -1064,60 +1323,56 @@ async def create_analytics_report(
 
     payload = {"reports": report_data}
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                "https://public.missiveapp.com/v1/analytics/reports",
-                headers={
-                    "Authorization": f"Bearer {api_token}",
-                    "Content-Type": "application/json"
-                },
-                json=payload
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            report = data.get("reports", {})
-
-            report_id = report.get('id')
-            
-            result = f"📊 Analytics Report Created!\n\n"
-            result += f"Report ID: {report_id}\n"
-            result += f"Organization: {organization_id}\n"
-            result += f"Date Range: {start_date} to {end_date}\n"
-            result += f"Time Zone: {time_zone}\n"
-
-            # Show applied filters
-            if team_ids:
-                result += f"Teams: {', '.join(team_ids)}\n"
-            if user_ids:
-                result += f"Users: {', '.join(user_ids)}\n"
-            if account_ids:
-                result += f"Accounts: {', '.join(account_ids)}\n"
-            if label_ids:
-                result += f"Labels: {', '.join(label_ids)}\n"
-
-            result += f"\n💡 Report is processing. Use get_analytics_report with ID '{report_id}' in ~5 seconds to fetch results."
+    client = get_client()
+    try:
+        response = await client.post(
+            "/v1/analytics/reports",
+            json=payload
+        )
+        response.raise_for_status()
+        data = response.json()
 
-            return result
+        report = data.get("reports", {})
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
-            elif e.response.status_code == 400:
-                error_detail = ""
-                try:
-                    error_data = e.response.json()
-                    error_detail = f" - {json.dumps(error_data)}"
-                except:
-                    error_detail = f" - {e.response.text}"
-                return f"Error: Invalid report parameters{error_detail}\n\nPayload sent: {json.dumps(payload, indent=2)}"
-            elif e.response.status_code == 404:
-                return f"Error: Organization {organization_id} not found or analytics not available."
-            else:
-                return f"Error creating analytics report: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error creating analytics report: {str(e)}"
+        report_id = report.get('id')
+        
+        result = f"📊 Analytics Report Created!\n\n"
+        result += f"Report ID: {report_id}\n"
+        result += f"Organization: {organization_id}\n"
+        result += f"Date Range: {start_date} to {end_date}\n"
+        result += f"Time Zone: {time_zone}\n"
+
+        # Show applied filters
+        if team_ids:
+            result += f"Teams: {', '.join(team_ids)}\n"
+        if user_ids:
+            result += f"Users: {', '.join(user_ids)}\n"
+        if account_ids:
+            result += f"Accounts: {', '.join(account_ids)}\n"
+        if label_ids:
+            result += f"Labels: {', '.join(label_ids)}\n"
+
+        result += f"\n💡 Report is processing. Use get_analytics_report with ID '{report_id}' in ~5 seconds to fetch results."
+
+        return result
+
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
+        elif e.response.status_code == 400:
+            error_detail = ""
+            try:
+                error_data = e.response.json()
+                error_detail = f" - {json.dumps(error_data)}"
+            except:
+                error_detail = f" - {e.response.text}"
+            return f"Error: Invalid report parameters{error_detail}\n\nPayload sent: {json.dumps(payload, indent=2)}"
+        elif e.response.status_code == 404:
+            return f"Error: Organization {organization_id} not found or analytics not available."
+        else:
+            return f"Error creating analytics report: HTTP {e.response.status_code}"
+    except Exception as e:
+        return f"Error creating analytics report: {str(e)}"
 
 
 @mcp.tool
@@ -1132,165 +1387,167 @@ async def get_analytics_report(report_id: str) -> str:
     """
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"https://public.missiveapp.com/v1/analytics/reports/{report_id}",
-                headers={"Authorization": f"Bearer {api_token}"}
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            report = data.get("reports", {})
-            if not report:
-                return f"Analytics report {report_id} not found or still processing. Try again in a few seconds."
-
-            result = f"📊 Analytics Report Results\n\n"
-
-            # Date range
-            start_ts = report.get("start")
-            end_ts = report.get("end")
-            if start_ts and end_ts:
-                start_date = datetime.fromtimestamp(start_ts).strftime("%d %b %Y")
-                end_date = datetime.fromtimestamp(end_ts).strftime("%d %b %Y")
-                result += f"📅 Period: {start_date} to {end_date}\n"
-                result += f"🌏 Timezone: {report.get('time_zone', 'UTC')}\n\n"
-
-            # Helper function to format seconds to human readable
-            def format_duration(seconds):
-                if not seconds:
-                    return "N/A"
-                seconds = int(seconds)
-                if seconds < 60:
-                    return f"{seconds}s"
-                elif seconds < 3600:
-                    mins = seconds // 60
-                    secs = seconds % 60
-                    return f"{mins}m {secs}s" if secs else f"{mins}m"
-                else:
-                    hours = seconds // 3600
-                    mins = (seconds % 3600) // 60
-                    return f"{hours}h {mins}m" if mins else f"{hours}h"
-
-            # Get selected period metrics
-            selected = report.get("selected_period", {})
-            previous = report.get("previous_period", {})
-            
-            if selected:
-                global_data = selected.get("global", {})
-                totals = global_data.get("totals", {})
-                metrics = totals.get("metrics", {})
+    client = get_client()
+    try:
+        response = await client.get(f"/v1/analytics/reports/{report_id}")
+        response.raise_for_status()
+        data = response.json()
+
+        report = data.get("reports", {})
+        if not report:
+            return f"Analytics report {report_id} not found or still processing. Try again in a few seconds."
+
+        parts = [f"📊 Analytics Report Results\n\n"]
+
+        # Date range
+        start_ts = report.get("start")
+        end_ts = report.get("end")
+        if start_ts and end_ts:
+            start_date = format_date(datetime.fromtimestamp(start_ts))
+            end_date = format_date(datetime.fromtimestamp(end_ts))
+            parts.append(f"📅 Period: {start_date} to {end_date}\n")
+            parts.append(f"🌏 Timezone: {report.get('time_zone', 'UTC')}\n\n")
+
+        # Helper function to format seconds to human readable
+        def format_duration(seconds):
+            if not seconds:
+                return "N/A"
+            seconds = int(seconds)
+            if seconds < 60:
+                return f"{seconds}s"
+            elif seconds < 3600:
+                mins = seconds // 60
+                secs = seconds % 60
+                return f"{mins}m {secs}s" if secs else f"{mins}m"
+            else:
+                hours = seconds // 3600
+                mins = (seconds % 3600) // 60
+                return f"{hours}h {mins}m" if mins else f"{hours}h"
+
+        # Helper to read a metric's value without allocating a default dict
+        def metric_value(source, key):
+            metric = source.get(key)
+            return metric.get("v", 0) if metric else 0
+
+        # Get selected period metrics
+        selected = report.get("selected_period", {})
+        previous = report.get("previous_period", {})
+        
+        if selected:
+            global_data = selected.get("global", {})
+            totals = global_data.get("totals", {})
+            metrics = totals.get("metrics", {})
+            
+            if metrics:
+                # Messages section
+                parts.append(_ANALYTICS_HR)
+                parts.append("📧 MESSAGES\n")
+                parts.append(_ANALYTICS_HR)
                 
-                if metrics:
-                    # Messages section
-                    result += "═" * 40 + "\n"
-                    result += "📧 MESSAGES\n"
-                    result += "═" * 40 + "\n"
-                    
-                    inbound = metrics.get("inbound_count", {}).get("v", 0)
-                    outbound = metrics.get("outbound_count", {}).get("v", 0)
-                    first_inbound = metrics.get("first_inbound_count", {}).get("v", 0)
-                    reply_count = metrics.get("reply_count", {}).get("v", 0)
-                    first_reply = metrics.get("first_reply_count", {}).get("v", 0)
-                    
-                    result += f"  Messages received:     {inbound:,}\n"
-                    result += f"  Messages sent:         {outbound:,}\n"
-                    result += f"  New conversations:     {first_inbound:,}\n"
-                    result += f"  Conversations replied: {first_reply:,}\n"
-                    result += f"  Total replies:         {reply_count:,}\n\n"
-                    
-                    # Response times section
-                    result += "═" * 40 + "\n"
-                    result += "⏱️  RESPONSE TIMES\n"
-                    result += "═" * 40 + "\n"
-                    
-                    first_reply_avg = metrics.get("first_reply_time_avg", {}).get("v", 0)
-                    reply_avg = metrics.get("reply_time_avg", {}).get("v", 0)
-                    handle_avg = metrics.get("handle_time_avg", {}).get("v", 0)
-                    
-                    result += f"  First reply time (avg): {format_duration(first_reply_avg)}\n"
-                    result += f"  Reply time (avg):       {format_duration(reply_avg)}\n"
-                    result += f"  Handle time (avg):      {format_duration(handle_avg)}\n\n"
-                    
-                    # First reply time distribution
-                    tallies = totals.get("tallies", {})
-                    first_reply_dist = tallies.get("first_reply_time_counts", [])
-                    
-                    if first_reply_dist:
-                        result += "═" * 40 + "\n"
-                        result += "📊 FIRST REPLY TIME DISTRIBUTION\n"
-                        result += "═" * 40 + "\n"
-                        
-                        # Group into meaningful buckets
-                        under_15m = sum(item.get("v", 0) for item in first_reply_dist if item.get("d") in ["1m", "2m", "3m", "4m", "5m", "10m", "15m"])
-                        under_1h = sum(item.get("v", 0) for item in first_reply_dist if item.get("d") in ["30m", "45m", "1h"])
-                        under_4h = sum(item.get("v", 0) for item in first_reply_dist if item.get("d") in ["2h", "3h", "4h"])
-                        under_12h = sum(item.get("v", 0) for item in first_reply_dist if item.get("d") in ["6h", "8h", "10h", "12h"])
-                        under_48h = sum(item.get("v", 0) for item in first_reply_dist if item.get("d") in ["24h", "48h"])
-                        over_48h = sum(item.get("v", 0) for item in first_reply_dist if item.get("d") in ["72h", "72h_plus"])
-                        
-                        total_replies = under_15m + under_1h + under_4h + under_12h + under_48h + over_48h
-                        
-                        if total_replies > 0:
-                            result += f"  Under 15 min:  {under_15m:>5} ({under_15m*100//total_replies}%)\n"
-                            result += f"  15min - 1hr:   {under_1h:>5} ({under_1h*100//total_replies}%)\n"
-                            result += f"  1hr - 4hr:     {under_4h:>5} ({under_4h*100//total_replies}%)\n"
-                            result += f"  4hr - 12hr:    {under_12h:>5} ({under_12h*100//total_replies}%)\n"
-                            result += f"  12hr - 48hr:   {under_48h:>5} ({under_48h*100//total_replies}%)\n"
-                            result += f"  Over 48hr:     {over_48h:>5} ({over_48h*100//total_replies}%)\n"
-                        result += "\n"
-
-            # Compare with previous period if available
-            if previous:
-                prev_global = previous.get("global", {})
-                prev_totals = prev_global.get("totals", {})
-                prev_metrics = prev_totals.get("metrics", {})
+                inbound = metric_value(metrics, "inbound_count")
+                outbound = metric_value(metrics, "outbound_count")
+                first_inbound = metric_value(metrics, "first_inbound_count")
+                reply_count = metric_value(metrics, "reply_count")
+                first_reply = metric_value(metrics, "first_reply_count")
                 
-                if prev_metrics and metrics:
-                    result += "═" * 40 + "\n"
-                    result += "📈 VS PREVIOUS PERIOD\n"
-                    result += "═" * 40 + "\n"
-                    
-                    curr_inbound = metrics.get("inbound_count", {}).get("v", 0)
-                    prev_inbound = prev_metrics.get("inbound_count", {}).get("v", 0)
-                    
-                    curr_outbound = metrics.get("outbound_count", {}).get("v", 0)
-                    prev_outbound = prev_metrics.get("outbound_count", {}).get("v", 0)
+                parts.append(f"  Messages received:     {inbound:,}\n")
+                parts.append(f"  Messages sent:         {outbound:,}\n")
+                parts.append(f"  New conversations:     {first_inbound:,}\n")
+                parts.append(f"  Conversations replied: {first_reply:,}\n")
+                parts.append(f"  Total replies:         {reply_count:,}\n\n")
+                
+                # Response times section
+                parts.append(_ANALYTICS_HR)
+                parts.append("⏱️  RESPONSE TIMES\n")
+                parts.append(_ANALYTICS_HR)
+                
+                first_reply_avg = metric_value(metrics, "first_reply_time_avg")
+                reply_avg = metric_value(metrics, "reply_time_avg")
+                handle_avg = metric_value(metrics, "handle_time_avg")
+                
+                parts.append(f"  First reply time (avg): {format_duration(first_reply_avg)}\n")
+                parts.append(f"  Reply time (avg):       {format_duration(reply_avg)}\n")
+                parts.append(f"  Handle time (avg):      {format_duration(handle_avg)}\n\n")
+                
+                # First reply time distribution
+                tallies = totals.get("tallies", {})
+                first_reply_dist = tallies.get("first_reply_time_counts", [])
+                
+                if first_reply_dist:
+                    parts.append(_ANALYTICS_HR)
+                    parts.append("📊 FIRST REPLY TIME DISTRIBUTION\n")
+                    parts.append(_ANALYTICS_HR)
                     
-                    curr_first_reply = metrics.get("first_reply_time_avg", {}).get("v", 0)
-                    prev_first_reply = prev_metrics.get("first_reply_time_avg", {}).get("v", 0)
+                    # Group into meaningful buckets
+                    under_15m = sum(item.get("v", 0) for item in first_reply_dist if item.get("d") in ["1m", "2m", "3m", "4m", "5m", "10m", "15m"])
+                    under_1h = sum(item.get("v", 0) for item in first_reply_dist if item.get("d") in ["30m", "45m", "1h"])
+                    under_4h = sum(item.get("v", 0) for item in first_reply_dist if item.get("d") in ["2h", "3h", "4h"])
+                    under_12h = sum(item.get("v", 0) for item in first_reply_dist if item.get("d") in ["6h", "8h", "10h", "12h"])
+                    under_48h = sum(item.get("v", 0) for item in first_reply_dist if item.get("d") in ["24h", "48h"])
+                    over_48h = sum(item.get("v", 0) for item in first_reply_dist if item.get("d") in ["72h", "72h_plus"])
                     
-                    def format_change(curr, prev, reverse=False):
-                        if prev == 0:
-                            return "N/A"
-                        change = ((curr - prev) / prev) * 100
-                        arrow = "↓" if change < 0 else "↑"
-                        # For times, down is good
-                        if reverse:
-                            colour = "better" if change < 0 else "worse"
-                        else:
-                            colour = "worse" if change < 0 else "better"
-                        return f"{arrow} {abs(change):.1f}%"
+                    total_replies = under_15m + under_1h + under_4h + under_12h + under_48h + over_48h
                     
-                    result += f"  Messages received: {format_change(curr_inbound, prev_inbound)} ({prev_inbound:,} → {curr_inbound:,})\n"
-                    result += f"  Messages sent:     {format_change(curr_outbound, prev_outbound)} ({prev_outbound:,} → {curr_outbound:,})\n"
-                    result += f"  First reply time:  {format_change(curr_first_reply, prev_first_reply, True)} ({format_duration(prev_first_reply)} → {format_duration(curr_first_reply)})\n"
+                    if total_replies > 0:
+                        parts.append(f"  Under 15 min:  {under_15m:>5} ({under_15m*100//total_replies}%)\n")
+                        parts.append(f"  15min - 1hr:   {under_1h:>5} ({under_1h*100//total_replies}%)\n")
+                        parts.append(f"  1hr - 4hr:     {under_4h:>5} ({under_4h*100//total_replies}%)\n")
+                        parts.append(f"  4hr - 12hr:    {under_12h:>5} ({under_12h*100//total_replies}%)\n")
+                        parts.append(f"  12hr - 48hr:   {under_48h:>5} ({under_48h*100//total_replies}%)\n")
+                        parts.append(f"  Over 48hr:     {over_48h:>5} ({over_48h*100//total_replies}%)\n")
+                    parts.append("\n")
+
+        # Compare with previous period if available
+        if previous:
+            prev_global = previous.get("global", {})
+            prev_totals = prev_global.get("totals", {})
+            prev_metrics = prev_totals.get("metrics", {})
+            
+            if prev_metrics and metrics:
+                parts.append(_ANALYTICS_HR)
+                parts.append("📈 VS PREVIOUS PERIOD\n")
+                parts.append(_ANALYTICS_HR)
+                
+                curr_inbound = metric_value(metrics, "inbound_count")
+                prev_inbound = metric_value(prev_metrics, "inbound_count")
+                
+                curr_outbound = metric_value(metrics, "outbound_count")
+                prev_outbound = metric_value(prev_metrics, "outbound_count")
+                
+                curr_first_reply = metric_value(metrics, "first_reply_time_avg")
+                prev_first_reply = metric_value(prev_metrics, "first_reply_time_avg")
+                
+                def format_change(curr, prev, reverse=False):
+                    if prev == 0:
+                        return "N/A"
+                    change = ((curr - prev) / prev) * 100
+                    arrow = "↓" if change < 0 else "↑"
+                    # For times, down is good
+                    if reverse:
+                        colour = "better" if change < 0 else "worse"
+                    else:
+                        colour = "worse" if change < 0 else "better"
+                    return f"{arrow} {abs(change):.1f}%"
+                
+                parts.append(f"  Messages received: {format_change(curr_inbound, prev_inbound)} ({prev_inbound:,} → {curr_inbound:,})\n")
+                parts.append(f"  Messages sent:     {format_change(curr_outbound, prev_outbound)} ({prev_outbound:,} → {curr_outbound:,})\n")
+                parts.append(f"  First reply time:  {format_change(curr_first_reply, prev_first_reply, True)} ({format_duration(prev_first_reply)} → {format_duration(curr_first_reply)})\n")
 
-            return result
+        return "".join(parts)
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
-            elif e.response.status_code == 404:
-                return f"Error: Analytics report {report_id} not found"
-            else:
-                return f"Error fetching analytics report: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error fetching analytics report: {str(e)}"
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 401:
+            return "Error: Invalid Missive API token. Please check your token in Claude Desktop config."
+        elif e.response.status_code == 404:
+            return f"Error: Analytics report {report_id} not found"
+        else:
+            return f"Error fetching analytics report: HTTP {e.response.status_code}"
+    except Exception as e:
+        return f"Error fetching analytics report: {str(e)}"
 
 
 # ============================================================================
@@ -1328,108 +1585,120 @@ async def create_draft(
     """
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
-    # Parse recipients JSON
+    # Validate recipients JSON; the raw text is spliced into the payload below
+    # rather than parsed and serialized again
     try:
-        to_fields = json.loads(to_fields_data)
-    except json.JSONDecodeError as e:
+        orjson.loads(to_fields_data)
+    except orjson.JSONDecodeError as e:
         return f"Error: Invalid JSON in to_fields_data: {str(e)}"
 
-    # Build draft payload
-    draft_data = {
-        "drafts": {
-            "from_field": {"address": account_id},
-            "to_fields": to_fields
-        }
+    # Build draft payload in one pass; unset (falsy) fields are left out
+    draft = {
+        "from_field": {"address": account_id},
+        **{key: value for key, value in (
+            ("subject", subject),
+            ("body", body),
+            ("send", send),
+            ("send_at", None if send else send_at),
+            ("conversation", conversation_id),
+            ("team", team_id),
+            ("add_shared_labels", add_shared_labels),
+            ("add_assignees", add_assignees),
+            ("close", close),
+        ) if value}
     }
+    # Drop the closing '}}' of {"drafts": {...}} and append the recipients
+    draft_payload = orjson.dumps({"drafts": draft})[:-2] + b',"to_fields":' + to_fields_data.encode() + b"}}"
 
-    if subject:
-        draft_data["drafts"]["subject"] = subject
-
-    if body:
-        draft_data["drafts"]["body"] = body
-
-    if send:
-        draft_data["drafts"]["send"] = True
+    client = get_client()
+    try:
+        response = await client.post(
+            "/v1/drafts",
+            content=draft_payload,
+            headers=_JSON_HEADERS
+        )
+        _read_cache.clear()
+        data = orjson.loads(response.content)
+
+        draft = data.get("drafts", {})
+
+        if send:
+            parts = [f"📤 Message Sent Successfully!\n\n"]
+        else:
+            parts = [f"📝 Draft Created Successfully!\n\n"]
 
-    if send_at and not send:
-        draft_data["drafts"]["send_at"] = send_at
+        parts.append(f"ID: {draft.get('id')}\n")
 
-    if conversation_id:
-        draft_data["drafts"]["conversation"] = conversation_id
+        if subject:
+            parts.append(f"Subject: {subject}\n")
 
-    if team_id:
-        draft_data["drafts"]["team"] = team_id
+        # Show recipients
+        parts.append(f"To: {to_fields_data}\n")
 
-    if add_shared_labels:
-        draft_data["drafts"]["add_shared_labels"] = add_shared_labels
+        if send_at and not send:
+            parts.append(f"Scheduled for: {format_timestamp(send_at)}\n")
 
-    if add_assignees:
-        draft_data["drafts"]["add_assignees"] = add_assignees
+        if conversation_id:
+            parts.append(f"Conversation: {conversation_id}\n")
 
-    if close:
-        draft_data["drafts"]["close"] = True
+        if team_id:
+            parts.append(f"Team: {team_id}\n")
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                "https://public.missiveapp.com/v1/drafts",
-                headers={
-                    "Authorization": f"Bearer {api_token}",
-                    "Content-Type": "application/json"
-                },
-                json=draft_data
-            )
-            response.raise_for_status()
-            data = response.json()
+        return "".join(parts)
 
-            draft = data.get("drafts", {})
+    except MissiveError as e:
+        return format_api_error(e, "creating draft", {400: "Invalid draft data"})
+    except Exception as e:
+        return f"Error creating draft: {str(e)}"
 
-            if send:
-                result = f"📤 Message Sent Successfully!\n\n"
-            else:
-                result = f"📝 Draft Created Successfully!\n\n"
 
-            result += f"ID: {draft.get('id')}\n"
+# Helper function to fetch a conversation's drafts (only the displayed fields)
+async def fetch_drafts(conversation_id: str, limit: int) -> list:
+    """Fetch drafts for a conversation"""
+    return await fetch_list_items(
+        f"/v1/conversations/{conversation_id}/drafts{_LIMIT_QS[min(max(limit, 0), 25)]}",
+        "drafts",
+        ("id", "subject", "to_fields", "send_at", "created_at")
+    )
 
-            if subject:
-                result += f"Subject: {subject}\n"
+# Helper function to format a list of drafts for display
+def format_drafts(drafts: list) -> str:
+    """Format drafts as a numbered list"""
+    parts = [f"📝 Drafts in Conversation ({len(drafts)} found):\n\n"]
 
-            # Show recipients
-            result += f"To: {to_fields_data}\n"
+    for i, draft in enumerate(drafts, 1):
+        parts.append(f"{i}. {draft.get('subject', 'No subject')}\n")
 
-            if send_at and not send:
-                result += f"Scheduled for: {format_timestamp(send_at)}\n"
+        # To fields
+        to_fields = draft.get("to_fields", [])
+        if to_fields:
+            to_names = ", ".join(
+                f"{name} <{address}>" if name else f"<{address}>"
+                for name, address in ((t.get("name", ""), t.get("address", "")) for t in to_fields)
+            )
+            parts.append(f"   To: {to_names}\n")
 
-            if conversation_id:
-                result += f"Conversation: {conversation_id}\n"
+        # Scheduled time
+        send_at = draft.get("send_at")
+        if send_at:
+            parts.append(f"   Scheduled: {format_timestamp(send_at)}\n")
 
-            if team_id:
-                result += f"Team: {team_id}\n"
+        # Created time
+        created_at = draft.get("created_at")
+        if created_at:
+            parts.append(f"   Created: {format_timestamp(created_at)}\n")
 
-            return result
+        parts.append(f"   Draft ID: {draft.get('id')}\n\n")
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token."
-            elif e.response.status_code == 400:
-                error_detail = ""
-                try:
-                    error_data = e.response.json()
-                    error_detail = f" - {error_data}"
-                except:
-                    pass
-                return f"Error: Invalid draft data{error_detail}"
-            else:
-                return f"Error creating draft: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error creating draft: {str(e)}"
+    return "".join(parts)
 
 
 @mcp.tool
+@ttl_cache(_READ_CACHE_TTL)
 async def get_conversation_drafts(conversation_id: str, limit: int = 10) -> str:
     """Get drafts from a specific conversation.
 
@@ -1439,58 +1708,21 @@ async def get_conversation_drafts(conversation_id: str, limit: int = 10) -> str:
     """
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"https://public.missiveapp.com/v1/conversations/{conversation_id}/drafts",
-                headers={"Authorization": f"Bearer {api_token}"},
-                params={"limit": min(limit, 25)}
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            drafts = data.get("drafts", [])
-            if not drafts:
-                return f"No drafts found in conversation {conversation_id}"
-
-            result = f"📝 Drafts in Conversation ({len(drafts)} found):\n\n"
-
-            for i, draft in enumerate(drafts, 1):
-                result += f"{i}. {draft.get('subject', 'No subject')}\n"
-
-                # To fields
-                to_fields = draft.get("to_fields", [])
-                if to_fields:
-                    to_names = [f"{t.get('name', '')} <{t.get('address', '')}>".strip() for t in to_fields]
-                    result += f"   To: {', '.join(to_names)}\n"
-
-                # Scheduled time
-                send_at = draft.get("send_at")
-                if send_at:
-                    result += f"   Scheduled: {format_timestamp(send_at)}\n"
-
-                # Created time
-                created_at = draft.get("created_at")
-                if created_at:
-                    result += f"   Created: {format_timestamp(created_at)}\n"
-
-                result += f"   Draft ID: {draft.get('id')}\n\n"
+    try:
+        drafts = await fetch_drafts(conversation_id, limit)
+        if not drafts:
+            return f"No drafts found in conversation {conversation_id}"
 
-            return result
+        return format_drafts(drafts)
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token."
-            elif e.response.status_code == 404:
-                return f"Error: Conversation {conversation_id} not found"
-            else:
-                return f"Error fetching drafts: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error fetching drafts: {str(e)}"
+    except MissiveError as e:
+        return format_api_error(e, "fetching drafts", {404: f"Conversation {conversation_id} not found"})
+    except Exception as e:
+        return f"Error fetching drafts: {str(e)}"
 
 
 @mcp.tool
@@ -1502,29 +1734,21 @@ async def delete_draft(draft_id: str) -> str:
     """
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.delete(
-                f"https://public.missiveapp.com/v1/drafts/{draft_id}",
-                headers={"Authorization": f"Bearer {api_token}"}
-            )
-            response.raise_for_status()
+    client = get_client()
+    try:
+        response = await client.delete(f"/v1/drafts/{draft_id}")
+        _read_cache.clear()
 
-            return f"✅ Draft {draft_id} deleted successfully."
+        return f"✅ Draft {draft_id} deleted successfully."
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token."
-            elif e.response.status_code == 404:
-                return f"Error: Draft {draft_id} not found"
-            else:
-                return f"Error deleting draft: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error deleting draft: {str(e)}"
+    except MissiveError as e:
+        return format_api_error(e, "deleting draft", {404: f"Draft {draft_id} not found"})
+    except Exception as e:
+        return f"Error deleting draft: {str(e)}"
 
 
 # ============================================================================
@@ -1575,136 +1799,122 @@ async def create_post(
     """
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
-    # Build post payload
-    post_data = {}
+    # Build post payload in one pass; unset (falsy) fields are left out
+    notification = {key: value for key, value in (
+        ("title", notification_title),
+        ("body", notification_body),
+    ) if value}
+    post_data = {key: value for key, value in (
+        ("conversation", conversation_id),
+        ("organization", organization_id),
+        ("notification", notification),
+        ("username", username),
+        ("username_icon", username_icon),
+        ("text", text),
+        ("markdown", markdown),
+        ("team", team_id),
+        ("add_shared_labels", add_shared_labels),
+        ("remove_shared_labels", remove_shared_labels),
+        ("add_assignees", add_assignees),
+        ("remove_assignees", remove_assignees),
+        ("close", close),
+        ("reopen", reopen),
+        ("add_to_inbox", add_to_inbox),
+    ) if value}
 
-    if conversation_id:
-        post_data["conversation"] = conversation_id
+    payload = {"posts": post_data}
 
-    if organization_id:
-        post_data["organization"] = organization_id
+    client = get_client()
+    try:
+        response = await client.post(
+            "/v1/posts",
+            content=orjson.dumps(payload),
+            headers=_JSON_HEADERS
+        )
+        _read_cache.clear()
+        data = orjson.loads(response.content)
 
-    if notification_title:
-        post_data["notification"] = post_data.get("notification", {})
-        post_data["notification"]["title"] = notification_title
+        post = data.get("posts", {})
 
-    if notification_body:
-        post_data["notification"] = post_data.get("notification", {})
-        post_data["notification"]["body"] = notification_body
+        parts = [
+            f"📌 Post Created Successfully!\n\n",
+            f"Post ID: {post.get('id')}\n"
+        ]
 
-    if username:
-        post_data["username"] = username
+        if username:
+            parts.append(f"Author: {username}\n")
 
-    if username_icon:
-        post_data["username_icon"] = username_icon
+        if text:
+            parts.append(f"Text: {truncate(text, 100)}\n")
+        elif markdown:
+            parts.append(f"Markdown: {truncate(markdown, 100)}\n")
 
-    if text:
-        post_data["text"] = text
+        # Show actions taken, reading the flags back from the payload
+        actions = [
+            label.format(n=len(post_data[key])) if counted else label
+            for key, label, counted in _POST_ACTIONS
+            if key in post_data
+        ]
 
-    if markdown:
-        post_data["markdown"] = markdown
+        if actions:
+            parts.append(f"Actions: {', '.join(actions)}\n")
 
-    if team_id:
-        post_data["team"] = team_id
+        # Conversation info
+        conversation = post.get("conversation", {})
+        if conversation:
+            parts.append(f"Conversation ID: {conversation.get('id')}\n")
 
-    if add_shared_labels:
-        post_data["add_shared_labels"] = add_shared_labels
+        return "".join(parts)
 
-    if remove_shared_labels:
-        post_data["remove_shared_labels"] = remove_shared_labels
+    except MissiveError as e:
+        return format_api_error(e, "creating post", {400: "Invalid post data"})
+    except Exception as e:
+        return f"Error creating post: {str(e)}"
 
-    if add_assignees:
-        post_data["add_assignees"] = add_assignees
 
-    if remove_assignees:
-        post_data["remove_assignees"] = remove_assignees
+# Helper function to fetch a conversation's posts; text is kept to one
+# character past the 150 shown so the "..." check still works
+async def fetch_posts(conversation_id: str, limit: int) -> list:
+    """Fetch posts for a conversation"""
+    return await fetch_list_items(
+        f"/v1/conversations/{conversation_id}/posts{_LIMIT_QS[min(max(limit, 0), 25)]}",
+        "posts",
+        ("id", "username", "text", "markdown", "created_at"),
+        max_chars=151
+    )
 
-    if close:
-        post_data["close"] = True
+# Helper function to format a list of posts for display
+def format_posts(posts: list) -> str:
+    """Format posts as a numbered list"""
+    parts = [f"📌 Posts in Conversation ({len(posts)} found):\n\n"]
 
-    if reopen:
-        post_data["reopen"] = True
+    for i, post in enumerate(posts, 1):
+        username = post.get("username", "Unknown")
+        parts.append(f"{i}. By: {username}\n")
 
-    if add_to_inbox:
-        post_data["add_to_inbox"] = True
+        text = post.get("text", "")
+        if text:
+            parts.append(f"   Text: {truncate(text, 150)}\n")
 
-    payload = {"posts": post_data}
+        markdown = post.get("markdown", "")
+        if markdown and not text:
+            parts.append(f"   Content: {truncate(markdown, 150)}\n")
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                "https://public.missiveapp.com/v1/posts",
-                headers={
-                    "Authorization": f"Bearer {api_token}",
-                    "Content-Type": "application/json"
-                },
-                json=payload
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            post = data.get("posts", {})
-
-            result = f"📌 Post Created Successfully!\n\n"
-            result += f"Post ID: {post.get('id')}\n"
-
-            if username:
-                result += f"Author: {username}\n"
-
-            if text:
-                result += f"Text: {text[:100]}{'...' if len(text) > 100 else ''}\n"
-            elif markdown:
-                result += f"Markdown: {markdown[:100]}{'...' if len(markdown) > 100 else ''}\n"
-
-            # Show actions taken
-            actions = []
-            if close:
-                actions.append("closed conversation")
-            if reopen:
-                actions.append("reopened conversation")
-            if add_to_inbox:
-                actions.append("moved to inbox")
-            if add_shared_labels:
-                actions.append(f"added {len(add_shared_labels)} label(s)")
-            if remove_shared_labels:
-                actions.append(f"removed {len(remove_shared_labels)} label(s)")
-            if add_assignees:
-                actions.append(f"assigned {len(add_assignees)} user(s)")
-            if remove_assignees:
-                actions.append(f"unassigned {len(remove_assignees)} user(s)")
-
-            if actions:
-                result += f"Actions: {', '.join(actions)}\n"
-
-            # Conversation info
-            conversation = post.get("conversation", {})
-            if conversation:
-                result += f"Conversation ID: {conversation.get('id')}\n"
+        created_at = post.get("created_at")
+        if created_at:
+            parts.append(f"   Created: {format_timestamp(created_at)}\n")
 
-            return result
+        parts.append(f"   Post ID: {post.get('id')}\n\n")
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token."
-            elif e.response.status_code == 400:
-                error_detail = ""
-                try:
-                    error_data = e.response.json()
-                    error_detail = f" - {error_data}"
-                except:
-                    pass
-                return f"Error: Invalid post data{error_detail}"
-            else:
-                return f"Error creating post: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error creating post: {str(e)}"
+    return "".join(parts)
 
 
 @mcp.tool
+@ttl_cache(_READ_CACHE_TTL)
 async def get_conversation_posts(conversation_id: str, limit: int = 10) -> str:
     """Get posts from a specific conversation.
 
@@ -1714,68 +1924,119 @@ async def get_conversation_posts(conversation_id: str, limit: int = 10) -> str:
     """
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"https://public.missiveapp.com/v1/conversations/{conversation_id}/posts",
-                headers={"Authorization": f"Bearer {api_token}"},
-                params={"limit": min(limit, 25)}
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            posts = data.get("posts", [])
-            if not posts:
-                return f"No posts found in conversation {conversation_id}"
+    try:
+        posts = await fetch_posts(conversation_id, limit)
+        if not posts:
+            return f"No posts found in conversation {conversation_id}"
 
-            result = f"📌 Posts in Conversation ({len(posts)} found):\n\n"
+        return format_posts(posts)
 
-            for i, post in enumerate(posts, 1):
-                result += f"{i}. "
+    except MissiveError as e:
+        return format_api_error(e, "fetching posts", {404: f"Conversation {conversation_id} not found"})
+    except Exception as e:
+        return f"Error fetching posts: {str(e)}"
 
-                username = post.get("username", "Unknown")
-                result += f"By: {username}\n"
 
-                text = post.get("text", "")
-                if text:
-                    result += f"   Text: {text[:150]}{'...' if len(text) > 150 else ''}\n"
+@mcp.tool
+@ttl_cache(_READ_CACHE_TTL)
+async def get_conversation_drafts_and_posts(conversation_id: str, limit: int = 10) -> str:
+    """Get drafts and posts from a conversation in one call (fetched concurrently).
 
-                markdown = post.get("markdown", "")
-                if markdown and not text:
-                    result += f"   Content: {markdown[:150]}{'...' if len(markdown) > 150 else ''}\n"
+    Args:
+        conversation_id: The ID of the conversation
+        limit: Number of drafts and of posts to return (max 25 each)
+    """
 
-                created_at = post.get("created_at")
-                if created_at:
-                    result += f"   Created: {format_timestamp(created_at)}\n"
+    try:
+        get_api_token()
+    except ValueError as e:
+        return f"Error: {str(e)}"
 
-                result += f"   Post ID: {post.get('id')}\n\n"
+    try:
+        drafts, posts = await asyncio.gather(
+            fetch_drafts(conversation_id, limit),
+            fetch_posts(conversation_id, limit)
+        )
 
-            return result
+        return "".join((
+            format_drafts(drafts) if drafts else f"No drafts found in conversation {conversation_id}\n\n",
+            format_posts(posts) if posts else f"No posts found in conversation {conversation_id}\n"
+        ))
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token."
-            elif e.response.status_code == 404:
-                return f"Error: Conversation {conversation_id} not found"
-            else:
-                return f"Error fetching posts: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error fetching posts: {str(e)}"
+    except MissiveError as e:
+        return format_api_error(e, "fetching drafts and posts", {404: f"Conversation {conversation_id} not found"})
+    except Exception as e:
+        return f"Error fetching drafts and posts: {str(e)}"
 
 
 # ============================================================================
 # CONTACTS ENDPOINTS
 # ============================================================================
 
+# Maximum page requests get_contacts_by_group has in flight at once
+_CONTACT_PAGE_CONCURRENCY = 5
+
+# Helper functions for list_contacts page cursors. The contacts endpoint only
+# pages by offset, so the opaque cursor wraps the offset of the next page
+def encode_cursor(offset: int) -> str:
+    """Encode a contacts page offset as an opaque cursor"""
+    return base64.urlsafe_b64encode(f"offset:{offset}".encode()).decode()
+
+def decode_cursor(cursor: str) -> int:
+    """Decode a contacts page cursor, raising ValueError if it is malformed"""
+    kind, _, value = base64.urlsafe_b64decode(cursor.encode()).decode().partition(":")
+    if kind != "offset":
+        raise ValueError(f"unknown cursor kind: {kind}")
+    return max(int(value), 0)
+
+# Helper functions to classify contact infos and memberships in one pass
+def split_infos(infos):
+    """Split contact infos into (email values, phone values)"""
+    emails, phones = [], []
+    for info in infos:
+        kind = info.get("kind")
+        if kind == "email":
+            emails.append(info.get("value"))
+        elif kind == "phone":
+            phones.append(info.get("value"))
+    return emails, phones
+
+def split_memberships(memberships):
+    """Split contact memberships into (organization names, group names)"""
+    orgs, groups = [], []
+    for m in memberships:
+        group = m.get("group") or _EMPTY
+        kind = group.get("kind")
+        if kind == "organization":
+            orgs.append(group.get("name"))
+        elif kind == "group":
+            groups.append(group.get("name"))
+    return orgs, groups
+
+# Helper function to read memberships given either as a list or a JSON string
+def parse_memberships(memberships_data: Union[str, list]) -> list:
+    """Parse and validate a memberships argument, raising ValueError if malformed"""
+    if isinstance(memberships_data, str):
+        try:
+            memberships_data = orjson.loads(memberships_data)
+        except orjson.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON in memberships_data: {str(e)}")
+    if not isinstance(memberships_data, list) or not all(isinstance(m, dict) and "group" in m for m in memberships_data):
+        raise ValueError('memberships_data must be a list of objects with a "group" key')
+    return memberships_data
+
+
 @mcp.tool
+@api_errors("fetching contacts")
 async def list_contacts(
     contact_book_id: Optional[str] = None,
     search: Optional[str] = None,
     limit: int = 50,
+    cursor: Optional[str] = None,
     offset: int = 0
 ) -> str:
     """List contacts from Missive.
@@ -1784,17 +2045,28 @@ async def list_contacts(
         contact_book_id: Filter by contact book ID
         search: Search term to filter contacts
         limit: Number of contacts to return (max 200)
-        offset: Offset for pagination
+        cursor: Page cursor from a previous call's "next page" hint
+        offset: Offset for pagination (deprecated, use cursor)
     """
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
+    if cursor:
+        try:
+            offset = decode_cursor(cursor)
+        except ValueError:
+            return f"Error: Invalid cursor {cursor}"
+
+    # Ask for one contact past the page to tell whether another page exists.
+    # The API caps limit at 200, so a full 200-contact page is assumed to have more
+    page_size = min(limit, 200)
+    offset = max(offset, 0)
     params = {
-        "limit": min(limit, 200),
-        "offset": max(offset, 0)
+        "limit": min(page_size + 1, 200),
+        "offset": offset
     }
 
     if contact_book_id:
@@ -1803,70 +2075,48 @@ async def list_contacts(
     if search:
         params["search"] = search
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "https://public.missiveapp.com/v1/contacts",
-                headers={"Authorization": f"Bearer {api_token}"},
-                params=params
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            contacts = data.get("contacts", [])
-            if not contacts:
-                return "No contacts found"
-
-            result = f"👤 Contacts ({len(contacts)} found):\n\n"
+    client = get_client()
+    response = await client.get(
+        "/v1/contacts",
+        params=params
+    )
+    data = orjson.loads(response.content)
 
-            for i, contact in enumerate(contacts, 1):
-                name = f"{contact.get('first_name', '')} {contact.get('last_name', '')}".strip()
-                if not name:
-                    name = "Unknown"
+    contacts = data.get("contacts", [])
+    if not contacts:
+        return "No contacts found"
 
-                result += f"{i}. {name}\n"
+    has_more = len(contacts) > page_size or len(contacts) == 200
+    contacts = contacts[:page_size]
 
-                # Email addresses
-                infos = contact.get("infos", [])
-                emails = [info.get("value") for info in infos if info.get("kind") == "email"]
-                if emails:
-                    result += f"   Email: {', '.join(emails[:2])}\n"
+    parts = [f"👤 Contacts ({len(contacts)} found):\n\n"]
 
-                # Phone numbers
-                phones = [info.get("value") for info in infos if info.get("kind") == "phone"]
-                if phones:
-                    result += f"   Phone: {', '.join(phones[:2])}\n"
+    for i, contact in enumerate(contacts, 1):
+        name = f"{contact.get('first_name', '')} {contact.get('last_name', '')}".strip()
+        if not name:
+            name = "Unknown"
 
-                # Organization memberships
-                memberships = contact.get("memberships", [])
-                orgs = [m.get("group", {}).get("name") for m in memberships
-                        if m.get("group", {}).get("kind") == "organization"]
-                if orgs:
-                    result += f"   Organization: {', '.join(orgs[:2])}\n"
+        emails, phones = split_infos(contact.get("infos") or _EMPTY_LIST)
+        orgs, groups = split_memberships(contact.get("memberships") or _EMPTY_LIST)
 
-                # Groups
-                groups = [m.get("group", {}).get("name") for m in memberships
-                         if m.get("group", {}).get("kind") == "group"]
-                if groups:
-                    result += f"   Groups: {', '.join(groups[:3])}\n"
+        parts.append(_CONTACT_TEMPLATE({
+            "i": i,
+            "name": name,
+            "email_line": f"   Email: {', '.join(emails[:2])}\n" if emails else "",
+            "phone_line": f"   Phone: {', '.join(phones[:2])}\n" if phones else "",
+            "org_line": f"   Organization: {', '.join(orgs[:2])}\n" if orgs else "",
+            "group_line": f"   Groups: {', '.join(groups[:3])}\n" if groups else "",
+            "id": contact.get("id"),
+        }))
 
-                result += f"   ID: {contact.get('id')}\n\n"
+    if has_more:
+        parts.append(f"📄 Use cursor={encode_cursor(offset + page_size)} to see more contacts.\n")
 
-            if len(contacts) == limit:
-                result += f"📄 Use offset={offset + limit} to see more contacts.\n"
-
-            return result
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token."
-            else:
-                return f"Error fetching contacts: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error fetching contacts: {str(e)}"
+    return "".join(parts)
 
 
 @mcp.tool
+@api_errors("fetching contact", {404: "Contact {contact_id} not found"})
 async def get_contact(contact_id: str) -> str:
     """Get details of a specific contact.
 
@@ -1875,95 +2125,83 @@ async def get_contact(contact_id: str) -> str:
     """
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                f"https://public.missiveapp.com/v1/contacts/{contact_id}",
-                headers={"Authorization": f"Bearer {api_token}"}
-            )
-            response.raise_for_status()
-            data = response.json()
+    client = get_client()
+    response = await client.get(f"/v1/contacts/{contact_id}")
+    data = orjson.loads(response.content)
 
-            # Handle both object and array responses from the API
-            contacts_data = data.get("contacts", {})
-            if isinstance(contacts_data, list):
-                contact = contacts_data[0] if contacts_data else {}
-            else:
-                contact = contacts_data
-
-            if not contact:
-                return f"Contact {contact_id} not found"
-
-            name = f"{contact.get('first_name', '')} {contact.get('last_name', '')}".strip()
-            if not name:
-                name = "Unknown"
-
-            result = f"👤 Contact Details:\n\n"
-            result += f"Name: {name}\n"
-            result += f"ID: {contact.get('id')}\n"
-
-            # Contact book
-            contact_book = contact.get("contact_book")
-            if contact_book:
-                result += f"Contact Book: {contact_book}\n"
-
-            # All info fields
-            infos = contact.get("infos", [])
-            if infos:
-                result += "\nContact Info:\n"
-                for info in infos:
-                    kind = info.get("kind", "unknown")
-                    value = info.get("value", "")
-                    label = info.get("label", "")
-                    if label:
-                        result += f"  {kind.title()} ({label}): {value}\n"
-                    else:
-                        result += f"  {kind.title()}: {value}\n"
-
-            # Memberships (organizations and groups)
-            memberships = contact.get("memberships", [])
-            if memberships:
-                result += "\nMemberships:\n"
-                for membership in memberships:
-                    group = membership.get("group", {})
-                    group_name = group.get("name", "Unknown")
-                    group_kind = group.get("kind", "unknown")
-                    title = membership.get("title", "")
-                    location = membership.get("location", "")
-
-                    if group_kind == "organization":
-                        result += f"  🏢 {group_name}"
-                        if title:
-                            result += f" - {title}"
-                        if location:
-                            result += f" ({location})"
-                        result += "\n"
-                    else:
-                        result += f"  🏷️ Group: {group_name}\n"
+    # Handle both object and array responses from the API
+    contacts_data = data.get("contacts", {})
+    if isinstance(contacts_data, list):
+        contact = contacts_data[0] if contacts_data else {}
+    else:
+        contact = contacts_data
 
-            # Notes
-            notes = contact.get("notes", "")
-            if notes:
-                result += f"\nNotes: {notes}\n"
+    if not contact:
+        return f"Contact {contact_id} not found"
 
-            return result
+    name = f"{contact.get('first_name', '')} {contact.get('last_name', '')}".strip()
+    if not name:
+        name = "Unknown"
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token."
-            elif e.response.status_code == 404:
-                return f"Error: Contact {contact_id} not found"
+    parts = [
+        f"👤 Contact Details:\n\n",
+        f"Name: {name}\n"
+    ]
+    parts.append(f"ID: {contact.get('id')}\n")
+
+    # Contact book
+    contact_book = contact.get("contact_book")
+    if contact_book:
+        parts.append(f"Contact Book: {contact_book}\n")
+
+    # All info fields
+    infos = contact.get("infos") or _EMPTY_LIST
+    if infos:
+        parts.append("\nContact Info:\n")
+        for info in infos:
+            kind = info.get("kind", "unknown")
+            value = info.get("value", "")
+            label = info.get("label", "")
+            if label:
+                parts.append(f"  {kind.title()} ({label}): {value}\n")
+            else:
+                parts.append(f"  {kind.title()}: {value}\n")
+
+    # Memberships (organizations and groups)
+    memberships = contact.get("memberships") or _EMPTY_LIST
+    if memberships:
+        parts.append("\nMemberships:\n")
+        for membership in memberships:
+            group = membership.get("group") or _EMPTY
+            group_name = group.get("name", "Unknown")
+            group_kind = group.get("kind", "unknown")
+            title = membership.get("title", "")
+            location = membership.get("location", "")
+
+            if group_kind == "organization":
+                parts.append(f"  🏢 {group_name}")
+                if title:
+                    parts.append(f" - {title}")
+                if location:
+                    parts.append(f" ({location})")
+                parts.append("\n")
             else:
-                return f"Error fetching contact: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error fetching contact: {str(e)}"
+                parts.append(f"  🏷️ Group: {group_name}\n")
+
+    # Notes
+    notes = contact.get("notes", "")
+    if notes:
+        parts.append(f"\nNotes: {notes}\n")
+
+    return "".join(parts)
 
 
 @mcp.tool
+@api_errors("creating contact", {400: "Invalid contact data"})
 async def create_contact(
     contact_book_id: str,
     first_name: Optional[str] = None,
@@ -1971,7 +2209,7 @@ async def create_contact(
     email: Optional[str] = None,
     phone: Optional[str] = None,
     notes: Optional[str] = None,
-    memberships_data: Optional[str] = None
+    memberships_data: Optional[Union[str, list]] = None
 ) -> str:
     """Create a new contact.
 
@@ -1982,11 +2220,11 @@ async def create_contact(
         email: Contact's email address
         phone: Contact's phone number
         notes: Notes about the contact
-        memberships_data: JSON string for group/org memberships (e.g., '[{"group": {"kind": "group", "name": "VIPs"}}]')
+        memberships_data: Group/org memberships as a list or JSON string (e.g., '[{"group": {"kind": "group", "name": "VIPs"}}]')
     """
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
@@ -2016,71 +2254,52 @@ async def create_contact(
     # Parse memberships if provided
     if memberships_data:
         try:
-            memberships = json.loads(memberships_data)
-            contact_data["memberships"] = memberships
-        except json.JSONDecodeError as e:
-            return f"Error: Invalid JSON in memberships_data: {str(e)}"
+            contact_data["memberships"] = parse_memberships(memberships_data)
+        except ValueError as e:
+            return f"Error: {str(e)}"
 
     payload = {"contacts": contact_data}
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(
-                "https://public.missiveapp.com/v1/contacts",
-                headers={
-                    "Authorization": f"Bearer {api_token}",
-                    "Content-Type": "application/json"
-                },
-                json=payload
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # Handle both object and array responses from the API
-            contacts_data = data.get("contacts", {})
-            if isinstance(contacts_data, list):
-                contact = contacts_data[0] if contacts_data else {}
-            else:
-                contact = contacts_data
-
-            name = f"{contact.get('first_name', '')} {contact.get('last_name', '')}".strip()
-            if not name:
-                name = "New Contact"
+    client = get_client()
+    response = await client.post(
+        "/v1/contacts",
+        content=orjson.dumps(payload),
+        headers=_JSON_HEADERS
+    )
+    data = orjson.loads(response.content)
+
+    # Handle both object and array responses from the API
+    contacts_data = data.get("contacts", {})
+    if isinstance(contacts_data, list):
+        contact = contacts_data[0] if contacts_data else {}
+    else:
+        contact = contacts_data
 
-            result = f"✅ Contact Created Successfully!\n\n"
-            result += f"Name: {name}\n"
-            result += f"ID: {contact.get('id')}\n"
+    name = f"{contact.get('first_name', '')} {contact.get('last_name', '')}".strip()
+    if not name:
+        name = "New Contact"
 
-            if email:
-                result += f"Email: {email}\n"
-            if phone:
-                result += f"Phone: {phone}\n"
+    parts = [
+        f"✅ Contact Created Successfully!\n\n",
+        f"Name: {name}\n"
+    ]
+    parts.append(f"ID: {contact.get('id')}\n")
 
-            memberships = contact.get("memberships", [])
-            if memberships:
-                groups = [m.get("group", {}).get("name") for m in memberships]
-                result += f"Groups: {', '.join(groups)}\n"
+    if email:
+        parts.append(f"Email: {email}\n")
+    if phone:
+        parts.append(f"Phone: {phone}\n")
 
-            return result
+    memberships = contact.get("memberships") or _EMPTY_LIST
+    if memberships:
+        groups = [(m.get("group") or _EMPTY).get("name") for m in memberships]
+        parts.append(f"Groups: {', '.join(groups)}\n")
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token."
-            elif e.response.status_code == 400:
-                error_detail = ""
-                try:
-                    error_data = e.response.json()
-                    error_detail = f" - {error_data}"
-                except:
-                    pass
-                return f"Error: Invalid contact data{error_detail}"
-            else:
-                return f"Error creating contact: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error creating contact: {str(e)}"
+    return "".join(parts)
 
 
 @mcp.tool
+@api_errors("updating contact", {400: "Invalid contact data", 404: "Contact {contact_id} not found"})
 async def update_contact(
     contact_id: str,
     first_name: Optional[str] = None,
@@ -2088,7 +2307,7 @@ async def update_contact(
     email: Optional[str] = None,
     phone: Optional[str] = None,
     notes: Optional[str] = None,
-    memberships_data: Optional[str] = None
+    memberships_data: Optional[Union[str, list]] = None
 ) -> str:
     """Update an existing contact.
 
@@ -2102,11 +2321,11 @@ async def update_contact(
         email: New email address (replaces existing emails)
         phone: New phone number (replaces existing phones)
         notes: New notes
-        memberships_data: JSON string for ALL group/org memberships
+        memberships_data: ALL group/org memberships, as a list or JSON string
     """
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
@@ -2134,10 +2353,9 @@ async def update_contact(
     # Parse memberships if provided
     if memberships_data is not None:
         try:
-            memberships = json.loads(memberships_data)
-            contact_data["memberships"] = memberships
-        except json.JSONDecodeError as e:
-            return f"Error: Invalid JSON in memberships_data: {str(e)}"
+            contact_data["memberships"] = parse_memberships(memberships_data)
+        except ValueError as e:
+            return f"Error: {str(e)}"
 
     if not contact_data:
         return "Error: At least one field must be provided to update"
@@ -2146,64 +2364,48 @@ async def update_contact(
     contact_data["id"] = contact_id
     payload = {"contacts": [contact_data]}
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.patch(
-                f"https://public.missiveapp.com/v1/contacts/{contact_id}",
-                headers={
-                    "Authorization": f"Bearer {api_token}",
-                    "Content-Type": "application/json"
-                },
-                json=payload
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # Handle both object and array responses from the API
-            contacts_data = data.get("contacts", {})
-            if isinstance(contacts_data, list):
-                contact = contacts_data[0] if contacts_data else {}
-            else:
-                contact = contacts_data
-
-            name = f"{contact.get('first_name', '')} {contact.get('last_name', '')}".strip()
-            if not name:
-                name = "Contact"
+    client = get_client()
+    response = await client.patch(
+        f"/v1/contacts/{contact_id}",
+        content=orjson.dumps(payload),
+        headers=_JSON_HEADERS
+    )
+    data = orjson.loads(response.content)
+
+    # Handle both object and array responses from the API
+    contacts_data = data.get("contacts", {})
+    if isinstance(contacts_data, list):
+        contact = contacts_data[0] if contacts_data else {}
+    else:
+        contact = contacts_data
 
-            result = f"✅ Contact Updated Successfully!\n\n"
-            result += f"Name: {name}\n"
-            result += f"ID: {contact.get('id')}\n"
+    name = f"{contact.get('first_name', '')} {contact.get('last_name', '')}".strip()
+    if not name:
+        name = "Contact"
 
-            infos = contact.get("infos", [])
-            emails = [info.get("value") for info in infos if info.get("kind") == "email"]
-            phones = [info.get("value") for info in infos if info.get("kind") == "phone"]
+    parts = [
+        f"✅ Contact Updated Successfully!\n\n",
+        f"Name: {name}\n"
+    ]
+    parts.append(f"ID: {contact.get('id')}\n")
 
-            if emails:
-                result += f"Email: {', '.join(emails)}\n"
-            if phones:
-                result += f"Phone: {', '.join(phones)}\n"
+    emails, phones = split_infos(contact.get("infos") or _EMPTY_LIST)
 
-            memberships = contact.get("memberships", [])
-            if memberships:
-                groups = [m.get("group", {}).get("name") for m in memberships]
-                result += f"Groups: {', '.join(groups)}\n"
+    if emails:
+        parts.append(f"Email: {', '.join(emails)}\n")
+    if phones:
+        parts.append(f"Phone: {', '.join(phones)}\n")
 
-            return result
+    memberships = contact.get("memberships") or _EMPTY_LIST
+    if memberships:
+        groups = [(m.get("group") or _EMPTY).get("name") for m in memberships]
+        parts.append(f"Groups: {', '.join(groups)}\n")
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token."
-            elif e.response.status_code == 404:
-                return f"Error: Contact {contact_id} not found"
-            elif e.response.status_code == 400:
-                return f"Error: Invalid contact data"
-            else:
-                return f"Error updating contact: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error updating contact: {str(e)}"
+    return "".join(parts)
 
 
 @mcp.tool
+@api_errors("deleting contact", {404: "Contact {contact_id} not found"})
 async def delete_contact(contact_id: str) -> str:
     """Delete a contact.
 
@@ -2212,78 +2414,46 @@ async def delete_contact(contact_id: str) -> str:
     """
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.delete(
-                f"https://public.missiveapp.com/v1/contacts/{contact_id}",
-                headers={"Authorization": f"Bearer {api_token}"}
-            )
-            response.raise_for_status()
-
-            return f"✅ Contact {contact_id} deleted successfully."
+    client = get_client()
+    response = await client.delete(f"/v1/contacts/{contact_id}")
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token."
-            elif e.response.status_code == 404:
-                return f"Error: Contact {contact_id} not found"
-            else:
-                return f"Error deleting contact: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error deleting contact: {str(e)}"
+    return f"✅ Contact {contact_id} deleted successfully."
 
 
 @mcp.tool
+@api_errors("fetching contact books")
 async def list_contact_books() -> str:
     """List all contact books the authenticated user has access to."""
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "https://public.missiveapp.com/v1/contact_books",
-                headers={"Authorization": f"Bearer {api_token}"}
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            contact_books = data.get("contact_books", [])
-            if not contact_books:
-                return "No contact books found"
-
-            result = f"📚 Contact Books ({len(contact_books)} found):\n\n"
+    client = get_client()
+    response = await client.get("/v1/contact_books")
+    data = orjson.loads(response.content)
 
-            for i, book in enumerate(contact_books, 1):
-                result += f"{i}. {book.get('name', 'Unnamed')}\n"
-                result += f"   ID: {book.get('id')}\n"
+    contact_books = data.get("contact_books", [])
+    if not contact_books:
+        return "No contact books found"
 
-                # Show if shared
-                shared = book.get("shared", False)
-                if shared:
-                    result += f"   Shared: Yes\n"
+    parts = [f"📚 Contact Books ({len(contact_books)} found):\n\n"]
 
-                result += "\n"
-
-            return result
+    for i, book in enumerate(contact_books, 1):
+        # Show if shared
+        shared_line = "   Shared: Yes\n" if book.get("shared", False) else ""
+        parts.append(f"{i}. {book.get('name', 'Unnamed')}\n   ID: {book.get('id')}\n{shared_line}\n")
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token."
-            else:
-                return f"Error fetching contact books: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error fetching contact books: {str(e)}"
+    return "".join(parts)
 
 
 @mcp.tool
+@api_errors("fetching groups", {404: "Contact book {contact_book_id} not found"})
 async def list_contact_groups(
     contact_book_id: str,
     kind: str = "group"
@@ -2296,139 +2466,181 @@ async def list_contact_groups(
     """
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
     if kind not in ["group", "organization"]:
         return "Error: kind must be 'group' or 'organization'"
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "https://public.missiveapp.com/v1/contact_groups",
-                headers={"Authorization": f"Bearer {api_token}"},
-                params={"contact_book": contact_book_id, "kind": kind}
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            contact_groups = data.get("contact_groups", [])
-            if not contact_groups:
-                return f"No {kind}s found in contact book {contact_book_id}"
+    client = get_client()
+    response = await client.get(
+        "/v1/contact_groups",
+        params={"contact_book": contact_book_id, "kind": kind}
+    )
+    data = orjson.loads(response.content)
 
-            emoji = "🏢" if kind == "organization" else "🏷️"
-            result = f"{emoji} {kind.title()}s ({len(contact_groups)} found):\n\n"
+    contact_groups = data.get("contact_groups", [])
+    if not contact_groups:
+        return f"No {kind}s found in contact book {contact_book_id}"
 
-            for i, group in enumerate(contact_groups, 1):
-                result += f"{i}. {group.get('name', 'Unnamed')}\n"
-                result += f"   ID: {group.get('id')}\n\n"
+    emoji = "🏢" if kind == "organization" else "🏷️"
+    parts = [f"{emoji} {kind.title()}s ({len(contact_groups)} found):\n\n"]
 
-            return result
+    parts.extend(
+        f"{i}. {group.get('name', 'Unnamed')}\n   ID: {group.get('id')}\n\n"
+        for i, group in enumerate(contact_groups, 1)
+    )
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token."
-            elif e.response.status_code == 404:
-                return f"Error: Contact book {contact_book_id} not found"
-            else:
-                return f"Error fetching groups: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error fetching groups: {str(e)}"
+    return "".join(parts)
 
 
 @mcp.tool
+@api_errors("fetching contacts")
 async def get_contacts_by_group(
     contact_book_id: str,
     group_name: str,
-    limit: int = 200
+    limit: int = 200,
+    max_pages: int = 5
 ) -> str:
     """Get contacts that belong to a specific group.
 
     Note: The Missive API doesn't support filtering by group directly,
-    so this fetches contacts from the book and filters by group membership.
+    so this fetches pages of contacts from the book concurrently and
+    filters by group membership.
 
     Args:
         contact_book_id: The contact book ID (required)
         group_name: The name of the group to filter by (required)
-        limit: Maximum contacts to scan (max 200)
+        limit: Contacts per page to scan (1-200)
+        max_pages: Number of pages to scan (max 10)
     """
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
+    page_size = max(1, min(limit, 200))
     params = {
         "contact_book": contact_book_id,
-        "limit": min(limit, 200)
+        "limit": page_size
     }
 
-    async with httpx.AsyncClient() as client:
-        try:
+    client = get_client()
+    semaphore = asyncio.Semaphore(_CONTACT_PAGE_CONCURRENCY)
+
+    async def fetch_page(page: int) -> list:
+        async with semaphore:
             response = await client.get(
-                "https://public.missiveapp.com/v1/contacts",
-                headers={"Authorization": f"Bearer {api_token}"},
-                params=params
+                "/v1/contacts",
+                params={**params, "offset": page * page_size}
             )
-            response.raise_for_status()
-            data = response.json()
-
-            contacts = data.get("contacts", [])
-            if not contacts:
-                return f"No contacts found in contact book {contact_book_id}"
-
-            # Filter contacts by group membership
-            matching_contacts = []
-            for contact in contacts:
-                memberships = contact.get("memberships", [])
-                for m in memberships:
-                    group = m.get("group", {})
-                    if group.get("name", "").lower() == group_name.lower():
-                        matching_contacts.append(contact)
-                        break
-
-            if not matching_contacts:
-                return f"No contacts found in group '{group_name}'"
-
-            result = f"👤 Contacts in group '{group_name}' ({len(matching_contacts)} found):\n\n"
-
-            for i, contact in enumerate(matching_contacts, 1):
-                name = f"{contact.get('first_name', '')} {contact.get('last_name', '')}".strip()
-                if not name:
-                    name = "Unknown"
-
-                result += f"{i}. {name}\n"
-
-                # Email addresses
-                infos = contact.get("infos", [])
-                emails = [info.get("value") for info in infos if info.get("kind") == "email"]
-                if emails:
-                    result += f"   Email: {', '.join(emails[:2])}\n"
-
-                # Phone numbers
-                phones = [info.get("value") for info in infos if info.get("kind") == "phone"]
-                if phones:
-                    result += f"   Phone: {', '.join(phones[:2])}\n"
-
-                result += f"   ID: {contact.get('id')}\n\n"
-
-            return result
-
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token."
+        return orjson.loads(response.content).get("contacts", [])
+
+    # Fetch the first page alone; only fan out when the book has more. A
+    # later page that fails is skipped so the pages that loaded still count
+    pages = [await fetch_page(0)]
+    failed_pages = 0
+    if len(pages[0]) == page_size:
+        for page in await asyncio.gather(
+            *(fetch_page(page) for page in range(1, min(max_pages, 10))),
+            return_exceptions=True
+        ):
+            if isinstance(page, BaseException):
+                failed_pages += 1
             else:
-                return f"Error fetching contacts: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error fetching contacts: {str(e)}"
+                pages.append(page)
+    failed_note = f"\n⚠️ {failed_pages} page(s) could not be fetched; results may be incomplete.\n" if failed_pages else ""
+
+    # Merge pages, dropping any contact repeated across page boundaries
+    contacts = list({contact.get("id"): contact for page in pages for contact in page}.values())
+    if not contacts:
+        return f"No contacts found in contact book {contact_book_id}"
+
+    # Filter contacts by group membership
+    target = group_name.casefold()
+    matching_contacts = [
+        contact for contact in contacts
+        if any((m.get("group") or _EMPTY).get("name", "").casefold() == target for m in contact.get("memberships") or _EMPTY_LIST)
+    ]
+
+    if not matching_contacts:
+        return f"No contacts found in group '{group_name}'{failed_note}"
+
+    parts = [f"👤 Contacts in group '{group_name}' ({len(matching_contacts)} found):\n\n"]
+
+    for i, contact in enumerate(matching_contacts, 1):
+        name = f"{contact.get('first_name', '')} {contact.get('last_name', '')}".strip()
+        if not name:
+            name = "Unknown"
+
+        emails, phones = split_infos(contact.get("infos") or _EMPTY_LIST)
+
+        parts.append(_CONTACT_TEMPLATE({
+            "i": i,
+            "name": name,
+            "email_line": f"   Email: {', '.join(emails[:2])}\n" if emails else "",
+            "phone_line": f"   Phone: {', '.join(phones[:2])}\n" if phones else "",
+            "org_line": "",
+            "group_line": "",
+            "id": contact.get("id"),
+        }))
+
+    parts.append(failed_note)
+    return "".join(parts)
+
+
+# Contact group name -> ID maps by (contact book, kind), kept for a few
+# minutes since groups rarely change
+_GROUPS_CACHE_TTL = 300.0
+_GROUPS_CACHE_SIZE = 128
+_groups_cache: OrderedDict = OrderedDict()
+
+# Helper function to fetch a contact book's group IDs keyed by casefolded name
+async def fetch_group_ids(contact_book_id: str, group_kind: str) -> dict:
+    """Fetch group name -> ID for a contact book, or {} if the lookup fails"""
+    try:
+        response = await get_client().get(
+            "/v1/contact_groups",
+            params={"contact_book": contact_book_id, "kind": group_kind}
+        )
+    except MissiveError:
+        return {}
+    group_ids = {}
+    for g in orjson.loads(response.content).get("contact_groups", []):
+        group_ids.setdefault(g.get("name", "").casefold(), g.get("id"))
+    key = (contact_book_id, group_kind)
+    _groups_cache[key] = (time.monotonic(), group_ids)
+    _groups_cache.move_to_end(key)
+    if len(_groups_cache) > _GROUPS_CACHE_SIZE:
+        _groups_cache.popitem(last=False)
+    return group_ids
+
+# Helper functions to resolve a group name to its ID within a contact book
+def cached_group_id(contact_book_id: str, group_kind: str, group_name: str) -> Optional[str]:
+    """Return a group's ID from a fresh cached lookup, or None without any request"""
+    cached = _groups_cache.get((contact_book_id, group_kind))
+    if cached and time.monotonic() - cached[0] < _GROUPS_CACHE_TTL:
+        return cached[1].get(group_name.casefold())
+    return None
+
+async def find_group_id(contact_book_id: str, group_kind: str, group_name: str) -> Optional[str]:
+    """Look up a contact group's ID by name, or None if it is not found"""
+    # Cache miss, expired, or the group may have been created since: refetch
+    return (
+        cached_group_id(contact_book_id, group_kind, group_name)
+        or (await fetch_group_ids(contact_book_id, group_kind)).get(group_name.casefold())
+    )
 
 
 @mcp.tool
+@api_errors("updating contact", {404: "Contact {contact_id} not found"})
 async def add_contact_to_group(
     contact_id: str,
     group_name: str,
-    group_kind: str = "group"
+    group_kind: str = "group",
+    contact_book_id: Optional[str] = None
 ) -> str:
     """Add a contact to a group (preserving existing memberships).
 
@@ -2436,146 +2648,135 @@ async def add_contact_to_group(
         contact_id: The ID of the contact to update (required)
         group_name: The name of the group to add (required)
         group_kind: Type of group - 'group' or 'organization' (default: 'group')
+        contact_book_id: The contact's contact book ID, if known (lets the group lookup run alongside the contact fetch)
     """
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
     if group_kind not in ["group", "organization"]:
         return "Error: group_kind must be 'group' or 'organization'"
 
-    async with httpx.AsyncClient() as client:
-        try:
-            # First, fetch the current contact to get existing memberships
-            response = await client.get(
-                f"https://public.missiveapp.com/v1/contacts/{contact_id}",
-                headers={"Authorization": f"Bearer {api_token}"}
-            )
-            response.raise_for_status()
-            data = response.json()
+    client = get_client()
+    # Fetch the current contact to get existing memberships; when the
+    # contact book is known, resolve the target group from the cache or
+    # look it up at the same time
+    contact_request = client.get(f"/v1/contacts/{contact_id}")
+    target_group_id = cached_group_id(contact_book_id, group_kind, group_name) if contact_book_id else None
+    if contact_book_id and not target_group_id:
+        response, target_group_id = await asyncio.gather(
+            contact_request,
+            find_group_id(contact_book_id, group_kind, group_name)
+        )
+    else:
+        response = await contact_request
+    data = orjson.loads(response.content)
 
-            # Handle both object and array responses from the API
-            contacts_data = data.get("contacts", {})
-            if isinstance(contacts_data, list):
-                contact = contacts_data[0] if contacts_data else {}
-            else:
-                contact = contacts_data
-
-            if not contact:
-                return f"Error: Contact {contact_id} not found"
-
-            # Get existing memberships and contact book
-            existing_memberships = contact.get("memberships", [])
-            contact_book_id = contact.get("contact_book")
-
-            # Check if already in this group
-            for m in existing_memberships:
-                group = m.get("group", {})
-                if group.get("name", "").lower() == group_name.lower() and group.get("kind") == group_kind:
-                    return f"Contact is already in {group_kind} '{group_name}'"
-
-            # Look up the target group ID from the contact_groups endpoint
-            target_group_id = None
-            if contact_book_id:
-                groups_response = await client.get(
-                    "https://public.missiveapp.com/v1/contact_groups",
-                    headers={"Authorization": f"Bearer {api_token}"},
-                    params={"contact_book": contact_book_id, "kind": group_kind}
-                )
-                if groups_response.status_code == 200:
-                    groups_data = groups_response.json()
-                    for g in groups_data.get("contact_groups", []):
-                        if g.get("name", "").lower() == group_name.lower():
-                            target_group_id = g.get("id")
-                            break
-
-            if not target_group_id:
-                return f"Error: Group '{group_name}' not found in the contact book. Please create the group in Missive first."
-
-            # Build new memberships list (preserve existing + add new)
-            # Use documented format: kind + name
-            new_memberships = []
-            for m in existing_memberships:
-                group = m.get("group", {})
-                membership_entry = {
-                    "group": {
-                        "kind": group.get("kind", "group"),
-                        "name": group.get("name", "")
-                    }
-                }
-                # Preserve title/location for organizations
-                if m.get("title"):
-                    membership_entry["title"] = m.get("title")
-                if m.get("location"):
-                    membership_entry["location"] = m.get("location")
-                new_memberships.append(membership_entry)
-
-            # Add the new group using documented format (kind + name)
-            new_memberships.append({
-                "group": {
-                    "kind": group_kind,
-                    "name": group_name
-                }
-            })
-
-            # Update the contact - API expects contacts as an array with id
-            payload = {
-                "contacts": [{
-                    "id": contact_id,
-                    "memberships": new_memberships
-                }]
+    # Handle both object and array responses from the API
+    contacts_data = data.get("contacts", {})
+    if isinstance(contacts_data, list):
+        contact = contacts_data[0] if contacts_data else {}
+    else:
+        contact = contacts_data
+
+    if not contact:
+        return f"Error: Contact {contact_id} not found"
+
+    # Get existing memberships
+    existing_memberships = contact.get("memberships") or _EMPTY_LIST
+
+    # Check if already in this group
+    target = group_name.casefold()
+    for m in existing_memberships:
+        group = m.get("group") or _EMPTY
+        if group.get("name", "").casefold() == target and group.get("kind") == group_kind:
+            return f"Contact is already in {group_kind} '{group_name}'"
+
+    # Look up the target group ID in the contact's own book if it was not
+    # prefetched (or the caller's contact book did not match)
+    if contact.get("contact_book") != contact_book_id:
+        contact_book_id = contact.get("contact_book")
+        target_group_id = None
+        if contact_book_id:
+            target_group_id = await find_group_id(contact_book_id, group_kind, group_name)
+
+    if not target_group_id:
+        return f"Error: Group '{group_name}' not found in the contact book. Please create the group in Missive first."
+
+    # Build new memberships list (preserve existing + add new). The contacts
+    # PATCH replaces memberships wholesale and Missive has no add/remove
+    # membership operation, so the current list must be read and resent
+    # Use documented format: kind + name
+    new_memberships = []
+    for m in existing_memberships:
+        group = m.get("group") or _EMPTY
+        membership_entry = {
+            "group": {
+                "kind": group.get("kind", "group"),
+                "name": group.get("name", "")
             }
+        }
+        # Preserve title/location for organizations
+        if m.get("title"):
+            membership_entry["title"] = m.get("title")
+        if m.get("location"):
+            membership_entry["location"] = m.get("location")
+        new_memberships.append(membership_entry)
+
+    # Add the new group using documented format (kind + name)
+    new_memberships.append({
+        "group": {
+            "kind": group_kind,
+            "name": group_name
+        }
+    })
+
+    # Update the contact - API expects contacts as an array with id
+    payload = {
+        "contacts": [{
+            "id": contact_id,
+            "memberships": new_memberships
+        }]
+    }
 
-            response = await client.patch(
-                f"https://public.missiveapp.com/v1/contacts/{contact_id}",
-                headers={
-                    "Authorization": f"Bearer {api_token}",
-                    "Content-Type": "application/json"
-                },
-                json=payload
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # Handle both object and array responses from the API
-            contacts_data = data.get("contacts", {})
-            if isinstance(contacts_data, list):
-                updated_contact = contacts_data[0] if contacts_data else {}
-            else:
-                updated_contact = contacts_data
-
-            name = f"{updated_contact.get('first_name', '')} {updated_contact.get('last_name', '')}".strip()
-            if not name:
-                name = "Contact"
+    response = await client.patch(
+        f"/v1/contacts/{contact_id}",
+        content=orjson.dumps(payload),
+        headers=_JSON_HEADERS
+    )
+    data = orjson.loads(response.content)
+
+    # Handle both object and array responses from the API
+    contacts_data = data.get("contacts", {})
+    if isinstance(contacts_data, list):
+        updated_contact = contacts_data[0] if contacts_data else {}
+    else:
+        updated_contact = contacts_data
 
-            # List all current groups
-            memberships = updated_contact.get("memberships", [])
-            groups = [m.get("group", {}).get("name") for m in memberships if m.get("group", {}).get("kind") == "group"]
-            orgs = [m.get("group", {}).get("name") for m in memberships if m.get("group", {}).get("kind") == "organization"]
+    name = f"{updated_contact.get('first_name', '')} {updated_contact.get('last_name', '')}".strip()
+    if not name:
+        name = "Contact"
 
-            result = f"✅ Added {name} to {group_kind} '{group_name}'\n\n"
-            result += f"Contact ID: {contact_id}\n"
-            if groups:
-                result += f"Groups: {', '.join(groups)}\n"
-            if orgs:
-                result += f"Organizations: {', '.join(orgs)}\n"
+    # List all current groups
+    memberships = updated_contact.get("memberships") or _EMPTY_LIST
+    orgs, groups = split_memberships(memberships)
 
-            return result
+    parts = [
+        f"✅ Added {name} to {group_kind} '{group_name}'\n\n",
+        f"Contact ID: {contact_id}\n"
+    ]
+    if groups:
+        parts.append(f"Groups: {', '.join(groups)}\n")
+    if orgs:
+        parts.append(f"Organizations: {', '.join(orgs)}\n")
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token."
-            elif e.response.status_code == 404:
-                return f"Error: Contact {contact_id} not found"
-            else:
-                return f"Error updating contact: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error updating contact: {str(e)}"
+    return "".join(parts)
 
 
 @mcp.tool
+@api_errors("updating contact", {404: "Contact {contact_id} not found"})
 async def remove_contact_from_group(
     contact_id: str,
     group_name: str
@@ -2588,117 +2789,100 @@ async def remove_contact_from_group(
     """
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
-    async with httpx.AsyncClient() as client:
-        try:
-            # First, fetch the current contact to get existing memberships
-            response = await client.get(
-                f"https://public.missiveapp.com/v1/contacts/{contact_id}",
-                headers={"Authorization": f"Bearer {api_token}"}
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # Handle both object and array responses from the API
-            contacts_data = data.get("contacts", {})
-            if isinstance(contacts_data, list):
-                contact = contacts_data[0] if contacts_data else {}
-            else:
-                contact = contacts_data
-
-            if not contact:
-                return f"Error: Contact {contact_id} not found"
+    client = get_client()
+    # First, fetch the current contact to get existing memberships
+    response = await client.get(f"/v1/contacts/{contact_id}")
+    data = orjson.loads(response.content)
 
-            # Get existing memberships
-            existing_memberships = contact.get("memberships", [])
-
-            # Check if in this group
-            found = False
-            for m in existing_memberships:
-                group = m.get("group", {})
-                if group.get("name", "").lower() == group_name.lower():
-                    found = True
-                    break
-
-            if not found:
-                return f"Contact is not in group '{group_name}'"
-
-            # Build new memberships list (exclude the target group)
-            new_memberships = []
-            for m in existing_memberships:
-                group = m.get("group", {})
-                if group.get("name", "").lower() != group_name.lower():
-                    membership_entry = {
-                        "group": {
-                            "kind": group.get("kind", "group"),
-                            "name": group.get("name", "")
-                        }
-                    }
-                    # Preserve title/location for organizations
-                    if m.get("title"):
-                        membership_entry["title"] = m.get("title")
-                    if m.get("location"):
-                        membership_entry["location"] = m.get("location")
-                    new_memberships.append(membership_entry)
-
-            # Update the contact - API expects contacts as an array with id
-            payload = {
-                "contacts": [{
-                    "id": contact_id,
-                    "memberships": new_memberships
-                }]
+    # Handle both object and array responses from the API
+    contacts_data = data.get("contacts", {})
+    if isinstance(contacts_data, list):
+        contact = contacts_data[0] if contacts_data else {}
+    else:
+        contact = contacts_data
+
+    if not contact:
+        return f"Error: Contact {contact_id} not found"
+
+    # Get existing memberships
+    existing_memberships = contact.get("memberships") or _EMPTY_LIST
+
+    # Build new memberships list (exclude the target group), noting whether
+    # the contact was in it. The contacts PATCH replaces memberships
+    # wholesale, so the remaining ones are resent
+    target = group_name.casefold()
+    found = False
+    new_memberships = []
+    for m in existing_memberships:
+        group = m.get("group") or _EMPTY
+        existing_name = group.get("name", "")
+        if existing_name.casefold() == target:
+            found = True
+            continue
+        membership_entry = {
+            "group": {
+                "kind": group.get("kind", "group"),
+                "name": existing_name
             }
+        }
+        # Preserve title/location for organizations
+        title = m.get("title")
+        if title:
+            membership_entry["title"] = title
+        location = m.get("location")
+        if location:
+            membership_entry["location"] = location
+        new_memberships.append(membership_entry)
+
+    if not found:
+        return f"Contact is not in group '{group_name}'"
+
+    # Update the contact - API expects contacts as an array with id
+    payload = {
+        "contacts": [{
+            "id": contact_id,
+            "memberships": new_memberships
+        }]
+    }
 
-            response = await client.patch(
-                f"https://public.missiveapp.com/v1/contacts/{contact_id}",
-                headers={
-                    "Authorization": f"Bearer {api_token}",
-                    "Content-Type": "application/json"
-                },
-                json=payload
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # Handle both object and array responses from the API
-            contacts_data = data.get("contacts", {})
-            if isinstance(contacts_data, list):
-                updated_contact = contacts_data[0] if contacts_data else {}
-            else:
-                updated_contact = contacts_data
-
-            name = f"{updated_contact.get('first_name', '')} {updated_contact.get('last_name', '')}".strip()
-            if not name:
-                name = "Contact"
-
-            # List remaining groups
-            memberships = updated_contact.get("memberships", [])
-            groups = [m.get("group", {}).get("name") for m in memberships if m.get("group", {}).get("kind") == "group"]
-            orgs = [m.get("group", {}).get("name") for m in memberships if m.get("group", {}).get("kind") == "organization"]
-
-            result = f"✅ Removed {name} from group '{group_name}'\n\n"
-            result += f"Contact ID: {contact_id}\n"
-            if groups:
-                result += f"Remaining groups: {', '.join(groups)}\n"
-            elif orgs:
-                result += f"Organizations: {', '.join(orgs)}\n"
-            else:
-                result += "No remaining group memberships\n"
-
-            return result
+    response = await client.patch(
+        f"/v1/contacts/{contact_id}",
+        content=orjson.dumps(payload),
+        headers=_JSON_HEADERS
+    )
+    data = orjson.loads(response.content)
+
+    # Handle both object and array responses from the API
+    contacts_data = data.get("contacts", {})
+    if isinstance(contacts_data, list):
+        updated_contact = contacts_data[0] if contacts_data else {}
+    else:
+        updated_contact = contacts_data
+
+    name = f"{updated_contact.get('first_name', '')} {updated_contact.get('last_name', '')}".strip()
+    if not name:
+        name = "Contact"
+
+    # List remaining groups
+    memberships = updated_contact.get("memberships") or _EMPTY_LIST
+    orgs, groups = split_memberships(memberships)
+
+    parts = [
+        f"✅ Removed {name} from group '{group_name}'\n\n",
+        f"Contact ID: {contact_id}\n"
+    ]
+    if groups:
+        parts.append(f"Remaining groups: {', '.join(groups)}\n")
+    elif orgs:
+        parts.append(f"Organizations: {', '.join(orgs)}\n")
+    else:
+        parts.append("No remaining group memberships\n")
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token."
-            elif e.response.status_code == 404:
-                return f"Error: Contact {contact_id} not found"
-            else:
-                return f"Error updating contact: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error updating contact: {str(e)}"
+    return "".join(parts)
 
 
 # ============================================================================
@@ -2706,52 +2890,40 @@ async def remove_contact_from_group(
 # ============================================================================
 
 @mcp.tool
+@api_errors("fetching organizations")
 async def list_organizations() -> str:
     """List organizations the authenticated user is part of."""
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "https://public.missiveapp.com/v1/organizations",
-                headers={"Authorization": f"Bearer {api_token}"}
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            organizations = data.get("organizations", [])
-            if not organizations:
-                return "No organizations found"
+    client = get_client()
+    response = await client.get("/v1/organizations")
+    data = orjson.loads(response.content)
 
-            result = f"🏢 Organizations ({len(organizations)} found):\n\n"
+    organizations = data.get("organizations", [])
+    if not organizations:
+        return "No organizations found"
 
-            for i, org in enumerate(organizations, 1):
-                result += f"{i}. {org.get('name', 'Unnamed')}\n"
-                result += f"   ID: {org.get('id')}\n"
+    parts = [f"🏢 Organizations ({len(organizations)} found):\n\n"]
 
-                # Show plan if available
-                plan = org.get("plan", "")
-                if plan:
-                    result += f"   Plan: {plan}\n"
+    for i, org in enumerate(organizations, 1):
+        parts.append(f"{i}. {org.get('name', 'Unnamed')}\n   ID: {org.get('id')}\n")
 
-                result += "\n"
+        # Show plan if available
+        plan = org.get("plan", "")
+        if plan:
+            parts.append(f"   Plan: {plan}\n")
 
-            return result
+        parts.append("\n")
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token."
-            else:
-                return f"Error fetching organizations: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error fetching organizations: {str(e)}"
+    return "".join(parts)
 
 
 @mcp.tool
+@api_errors("fetching teams")
 async def list_teams(organization_id: Optional[str] = None) -> str:
     """List teams in organizations.
 
@@ -2760,7 +2932,7 @@ async def list_teams(organization_id: Optional[str] = None) -> str:
     """
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
@@ -2768,46 +2940,34 @@ async def list_teams(organization_id: Optional[str] = None) -> str:
     if organization_id:
         params["organization"] = organization_id
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "https://public.missiveapp.com/v1/teams",
-                headers={"Authorization": f"Bearer {api_token}"},
-                params=params
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            teams = data.get("teams", [])
-            if not teams:
-                filter_msg = f" in organization {organization_id}" if organization_id else ""
-                return f"No teams found{filter_msg}"
+    client = get_client()
+    response = await client.get(
+        "/v1/teams",
+        params=params
+    )
+    data = orjson.loads(response.content)
 
-            result = f"👥 Teams ({len(teams)} found):\n\n"
+    teams = data.get("teams", [])
+    if not teams:
+        filter_msg = f" in organization {organization_id}" if organization_id else ""
+        return f"No teams found{filter_msg}"
 
-            for i, team in enumerate(teams, 1):
-                result += f"{i}. {team.get('name', 'Unnamed')}\n"
-                result += f"   ID: {team.get('id')}\n"
+    parts = [f"👥 Teams ({len(teams)} found):\n\n"]
 
-                # Organization
-                org = team.get("organization")
-                if org:
-                    if isinstance(org, dict):
-                        result += f"   Organization: {org.get('name', org.get('id', 'Unknown'))}\n"
-                    else:
-                        result += f"   Organization: {org}\n"
+    for i, team in enumerate(teams, 1):
+        parts.append(f"{i}. {team.get('name', 'Unnamed')}\n   ID: {team.get('id')}\n")
 
-                result += "\n"
+        # Organization
+        org = team.get("organization")
+        if org:
+            if isinstance(org, dict):
+                parts.append(f"   Organization: {org.get('name', org.get('id', 'Unknown'))}\n")
+            else:
+                parts.append(f"   Organization: {org}\n")
 
-            return result
+        parts.append("\n")
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token."
-            else:
-                return f"Error fetching teams: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error fetching teams: {str(e)}"
+    return "".join(parts)
 
 
 # ============================================================================
@@ -2815,6 +2975,7 @@ async def list_teams(organization_id: Optional[str] = None) -> str:
 # ============================================================================
 
 @mcp.tool
+@api_errors("fetching shared labels")
 async def list_shared_labels(organization_id: Optional[str] = None) -> str:
     """List shared labels in organizations.
 
@@ -2823,7 +2984,7 @@ async def list_shared_labels(organization_id: Optional[str] = None) -> str:
     """
 
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
 
@@ -2831,65 +2992,82 @@ async def list_shared_labels(organization_id: Optional[str] = None) -> str:
     if organization_id:
         params["organization"] = organization_id
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                "https://public.missiveapp.com/v1/shared_labels",
-                headers={"Authorization": f"Bearer {api_token}"},
-                params=params
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            labels = data.get("shared_labels", [])
-            if not labels:
-                filter_msg = f" in organization {organization_id}" if organization_id else ""
-                return f"No shared labels found{filter_msg}"
-
-            result = f"🏷️ Shared Labels ({len(labels)} found):\n\n"
-
-            for i, label in enumerate(labels, 1):
-                result += f"{i}. {label.get('name', 'Unnamed')}\n"
-                result += f"   ID: {label.get('id')}\n"
-
-                # Color
-                color = label.get("color", "")
-                if color:
-                    result += f"   Color: {color}\n"
-
-                # Parent label (for hierarchical labels)
-                parent = label.get("parent")
-                if parent:
-                    if isinstance(parent, dict):
-                        result += f"   Parent: {parent.get('name', parent.get('id', 'Unknown'))}\n"
-                    else:
-                        result += f"   Parent: {parent}\n"
-
-                # Organization
-                org = label.get("organization")
-                if org:
-                    if isinstance(org, dict):
-                        result += f"   Organization: {org.get('name', org.get('id', 'Unknown'))}\n"
-                    else:
-                        result += f"   Organization: {org}\n"
+    client = get_client()
+    response = await client.get(
+        "/v1/shared_labels",
+        params=params
+    )
+    data = orjson.loads(response.content)
+
+    labels = data.get("shared_labels", [])
+    if not labels:
+        filter_msg = f" in organization {organization_id}" if organization_id else ""
+        return f"No shared labels found{filter_msg}"
+
+    parts = [f"🏷️ Shared Labels ({len(labels)} found):\n\n"]
+
+    for i, label in enumerate(labels, 1):
+        parts.append(f"{i}. {label.get('name', 'Unnamed')}\n   ID: {label.get('id')}\n")
+
+        # Color
+        color = label.get("color", "")
+        if color:
+            parts.append(f"   Color: {color}\n")
+
+        # Parent label (for hierarchical labels)
+        parent = label.get("parent")
+        if parent:
+            if isinstance(parent, dict):
+                parts.append(f"   Parent: {parent.get('name', parent.get('id', 'Unknown'))}\n")
+            else:
+                parts.append(f"   Parent: {parent}\n")
 
-                result += "\n"
+        # Organization
+        org = label.get("organization")
+        if org:
+            if isinstance(org, dict):
+                parts.append(f"   Organization: {org.get('name', org.get('id', 'Unknown'))}\n")
+            else:
+                parts.append(f"   Organization: {org}\n")
 
-            return result
+        parts.append("\n")
 
-        except httpx.HTTPStatusError as e:
-            if e.response.status_code == 401:
-                return "Error: Invalid Missive API token."
-            else:
-                return f"Error fetching shared labels: HTTP {e.response.status_code}"
-        except Exception as e:
-            return f"Error fetching shared labels: {str(e)}"
+    return "".join(parts)
 
 
 # ============================================================================
 # TEAM METRICS (Custom Analytics)
 # ============================================================================
 
+# Message-fetching workers, queued conversations and request rate used by
+# calculate_team_metrics (Missive allows bursts of 5 requests/second)
+_METRICS_CONCURRENCY = 5
+_METRICS_QUEUE_SIZE = 64
+_METRICS_RATE = 4.0
+
+# Sort key for messages in calculate_team_metrics
+_DELIVERED_AT = operator.itemgetter("delivered_at")
+
+# Section divider for calculate_team_metrics output
+_METRICS_HR = "═" * 45 + "\n"
+
+# Upper edges (in seconds) of the first reply time buckets: 15m, 1h, 4h, 12h, 48h
+_REPLY_TIME_EDGES = (900, 3600, 14400, 43200, 172800)
+
+class RateLimiter:
+    """Spaces out acquisitions to at most `rate` per second across concurrent tasks"""
+
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next = 0.0
+
+    async def acquire(self):
+        now = time.monotonic()
+        wait = self._next - now
+        self._next = max(now, self._next) + self._interval
+        if wait > 0:
+            await asyncio.sleep(wait)
+
 @mcp.tool
 async def calculate_team_metrics(
     team_id: str,
@@ -2917,10 +3095,9 @@ async def calculate_team_metrics(
                          (default: from TRACKED_CHANNELS env var, or auto-detect)
         max_conversations: Maximum conversations to analyse (default: 200, max: 2000)
     """
-    import asyncio
     
     try:
-        api_token = get_api_token()
+        get_api_token()
     except ValueError as e:
         return f"Error: {str(e)}"
     
@@ -2934,32 +3111,32 @@ async def calculate_team_metrics(
         return "Error: Dates must be in YYYY-MM-DD format"
     
     # Get internal domains (for determining inbound vs outbound)
-    if internal_domains:
-        domains = [d.strip().lower() for d in internal_domains.split(",")]
-    else:
-        env_domains = os.getenv("INTERNAL_DOMAINS", "example.com")
-        domains = [d.strip().lower() for d in env_domains.split(",")]
+    domains_raw = internal_domains or os.getenv("INTERNAL_DOMAINS", "example.com")
+    domains = [d.strip().casefold() for d in domains_raw.split(",")]
     
     # Get tracked channels if specified
     channels_to_track = None
-    if tracked_channels:
-        channels_to_track = [c.strip().lower() for c in tracked_channels.split(",")]
-    elif os.getenv("TRACKED_CHANNELS"):
-        channels_to_track = [c.strip().lower() for c in os.getenv("TRACKED_CHANNELS").split(",")]
+    tracked_raw = tracked_channels or os.getenv("TRACKED_CHANNELS")
+    if tracked_raw:
+        channels_to_track = frozenset(c.strip().casefold() for c in tracked_raw.split(","))
     
     # Limit max conversations
     max_conversations = min(max_conversations, 2000)
     
-    # Helper to check if email is internal
+    # Helper to check if email is internal (addresses repeat heavily across
+    # a team inbox, so results are memoized for this call). All domains are
+    # matched in one scan by a single pattern
+    internal_pattern = re.compile("|".join(re.escape(domain) for domain in domains))
+
+    @functools.lru_cache(maxsize=4096)
     def is_internal(email: str) -> bool:
         if not email:
             return False
-        email_lower = email.lower()
-        return any(domain in email_lower for domain in domains)
+        return internal_pattern.search(email.casefold()) is not None
     
     # Helper to extract email address
     def get_email(field: dict) -> str:
-        return (field.get("address") or "").lower() if field else ""
+        return (field.get("address") or "").casefold() if field else ""
     
     # Metrics containers
     metrics = {
@@ -2968,160 +3145,173 @@ async def calculate_team_metrics(
         "total_inbound": 0,
         "total_outbound": 0,
         "first_reply_times": [],  # in seconds
-        "channels_inbound": {},   # channel -> count
-        "channels_outbound": {},  # channel -> count
+        "channels_inbound": Counter(),   # channel -> count
+        "channels_outbound": Counter(),  # channel -> count
     }
     
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        # Fetch conversations from team inbox
-        conversations = []
-        
-        # We need to fetch from team_all to get all conversations including closed
-        # and filter by date ourselves
-        params = {"team_all": team_id, "limit": 50}
-        
-        while len(conversations) < max_conversations:
+    # Metrics requests keep the longer timeout they had on their own client
+    client = get_client()
+    timeout = httpx.Timeout(120.0, connect=5.0)
+    limiter = RateLimiter(_METRICS_RATE)
+
+    # Helper to add one conversation's messages to the metrics
+    def record_messages(messages):
+        # Filter messages by date range and sort by delivered time (oldest
+        # first); every message kept has a delivered_at
+        filtered_messages = sorted(
+            (msg for msg in messages if start_ts <= msg.get("delivered_at", 0) <= end_ts),
+            key=_DELIVERED_AT
+        )
+
+        # Process messages. Totals and channels count every message, so the
+        # loop cannot stop early once the first reply is found
+        first_inbound_time = None
+        first_outbound_time = None
+
+        for msg in filtered_messages:
+            from_field = msg.get("from_field", {})
+            to_fields = msg.get("to_fields", [])
+            delivered_at = msg["delivered_at"]
+
+            from_email = get_email(from_field)
+
+            # Determine if inbound or outbound
+            if is_internal(from_email):
+                # Outbound message (from internal)
+                metrics["total_outbound"] += 1
+
+                # Track channel (the from address for outbound)
+                if from_email:
+                    if channels_to_track is None or from_email in channels_to_track:
+                        metrics["channels_outbound"][from_email] += 1
+
+                # Track first outbound time for reply time calc
+                if first_outbound_time is None and first_inbound_time is not None:
+                    first_outbound_time = delivered_at
+            else:
+                # Inbound message (from external)
+                metrics["total_inbound"] += 1
+
+                # Track channel (the to address for inbound - which of our addresses received it)
+                metrics["channels_inbound"].update(
+                    to_email for to_email in map(get_email, to_fields)
+                    if is_internal(to_email) and (channels_to_track is None or to_email in channels_to_track)
+                )
+
+                # Track first inbound time
+                if first_inbound_time is None:
+                    first_inbound_time = delivered_at
+
+        # Calculate first reply time for this conversation
+        if first_inbound_time and first_outbound_time:
+            reply_time = first_outbound_time - first_inbound_time
+            if reply_time > 0:  # Sanity check
+                metrics["first_reply_times"].append(reply_time)
+                metrics["conversations_with_reply"] += 1
+
+    # Workers fetch the messages of queued conversations while later pages
+    # are still being listed. Page and message requests share the limiter,
+    # keeping under Missive's 5 requests/second limit
+    queue = asyncio.Queue(maxsize=_METRICS_QUEUE_SIZE)
+
+    async def analyse_conversations():
+        while True:
+            conv = await queue.get()
+            if conv is None:
+                return
+            await limiter.acquire()
+            try:
+                msg_response = await client.get(
+                    f"/v1/conversations/{conv.get('id')}/messages",
+                    params={"limit": 10},  # Missive API max is 10
+                    timeout=timeout
+                )
+                record_messages(orjson.loads(msg_response.content).get("messages", []))
+            except Exception:
+                # Skip this conversation if we can't fetch its messages
+                continue
+
+    workers = [asyncio.create_task(analyse_conversations()) for _ in range(_METRICS_CONCURRENCY)]
+
+    # Fetch conversations from team inbox, queueing those in the date range.
+    # We need to fetch from team_all to get all conversations including closed
+    # and filter by date ourselves
+    params = {"team_all": team_id, "limit": 50}
+    seen = set()
+
+    try:
+        while metrics["total_conversations"] < max_conversations:
             try:
+                await limiter.acquire()
                 response = await client.get(
-                    "https://public.missiveapp.com/v1/conversations",
-                    headers={"Authorization": f"Bearer {api_token}"},
-                    params=params
+                    "/v1/conversations",
+                    params=params,
+                    timeout=timeout
                 )
-                response.raise_for_status()
-                data = response.json()
-                
+                data = orjson.loads(response.content)
+            
                 batch = data.get("conversations", [])
                 if not batch:
                     break
-                
-                # Filter by date - check last_activity_at
+            
+                # Filter by date - check last_activity_at. A conversation last
+                # active before the start date has no messages in range, and
+                # conversations come most recent activity first, so the first
+                # such one ends the scan
+                past_start = False
+                seen_before = len(seen)
                 for conv in batch:
-                    last_activity = conv.get("last_activity_at", 0)
-                    created_at = conv.get("created_at", 0)
-                    
-                    # Include if activity falls within our date range
-                    if last_activity >= start_ts or created_at >= start_ts:
-                        if created_at <= end_ts:
-                            conversations.append(conv)
-                
-                # Check if we should continue (if oldest conv in batch is still in range)
-                if batch:
-                    oldest_activity = min(c.get("last_activity_at", 0) for c in batch)
-                    if oldest_activity < start_ts:
-                        # We've gone past our start date
+                    if conv.get("last_activity_at", 0) < start_ts:
+                        past_start = True
                         break
-                
+
+                    # Pages overlap at the 'until' boundary, so skip conversations
+                    # already seen
+                    conv_id = conv.get("id")
+                    if conv_id in seen:
+                        continue
+                    seen.add(conv_id)
+
+                    # Include if it was created before the end of our date range
+                    if conv.get("created_at", 0) <= end_ts:
+                        metrics["total_conversations"] += 1
+                        await queue.put(conv)
+            
+                # Stop once we've gone past our start date, or if the page had
+                # nothing new ('until' cannot move past a page of conversations
+                # sharing one timestamp)
+                if past_start or len(seen) == seen_before:
+                    break
+            
                 # Pagination - use the last conversation's ID for next batch
                 # Missive uses cursor-based pagination
                 if len(batch) < 50:
                     break
-                    
+                
                 # Get next page using 'until' parameter (Missive pagination)
                 last_conv = batch[-1]
                 params["until"] = last_conv.get("last_activity_at")
-                
-                # Rate limit: 2 requests per second (within 5/sec burst limit)
-                await asyncio.sleep(0.5)
-                
-            except httpx.HTTPStatusError as e:
+            
+            except MissiveError as e:
                 return f"Error fetching conversations: HTTP {e.response.status_code}"
             except Exception as e:
                 return f"Error fetching conversations: {str(e)}"
-        
-        metrics["total_conversations"] = len(conversations)
-        
-        if not conversations:
-            return f"No conversations found for team {team_id} in date range {start_date} to {end_date}"
-        
-        # Now fetch messages for each conversation and calculate metrics
-        progress_total = len(conversations)
-        
-        for idx, conv in enumerate(conversations):
-            conv_id = conv.get("id")
-            
-            try:
-                # Fetch messages for this conversation
-                msg_response = await client.get(
-                    f"https://public.missiveapp.com/v1/conversations/{conv_id}/messages",
-                    headers={"Authorization": f"Bearer {api_token}"},
-                    params={"limit": 10}  # Missive API max is 10
-                )
-                msg_response.raise_for_status()
-                msg_data = msg_response.json()
-                
-                messages = msg_data.get("messages", [])
-                
-                # Filter messages by date range and sort by delivered_at
-                filtered_messages = []
-                for msg in messages:
-                    delivered_at = msg.get("delivered_at", 0)
-                    if start_ts <= delivered_at <= end_ts:
-                        filtered_messages.append(msg)
-                
-                # Sort by delivered time (oldest first)
-                filtered_messages.sort(key=lambda m: m.get("delivered_at", 0))
-                
-                # Process messages
-                first_inbound_time = None
-                first_outbound_time = None
-                
-                for msg in filtered_messages:
-                    from_field = msg.get("from_field", {})
-                    to_fields = msg.get("to_fields", [])
-                    delivered_at = msg.get("delivered_at", 0)
-                    
-                    from_email = get_email(from_field)
-                    
-                    # Determine if inbound or outbound
-                    if is_internal(from_email):
-                        # Outbound message (from internal)
-                        metrics["total_outbound"] += 1
-                        
-                        # Track channel (the from address for outbound)
-                        if from_email:
-                            if channels_to_track is None or from_email in channels_to_track:
-                                metrics["channels_outbound"][from_email] = \
-                                    metrics["channels_outbound"].get(from_email, 0) + 1
-                        
-                        # Track first outbound time for reply time calc
-                        if first_outbound_time is None and first_inbound_time is not None:
-                            first_outbound_time = delivered_at
-                    else:
-                        # Inbound message (from external)
-                        metrics["total_inbound"] += 1
-                        
-                        # Track channel (the to address for inbound - which of our addresses received it)
-                        for to_field in to_fields:
-                            to_email = get_email(to_field)
-                            if is_internal(to_email):
-                                if channels_to_track is None or to_email in channels_to_track:
-                                    metrics["channels_inbound"][to_email] = \
-                                        metrics["channels_inbound"].get(to_email, 0) + 1
-                        
-                        # Track first inbound time
-                        if first_inbound_time is None:
-                            first_inbound_time = delivered_at
-                
-                # Calculate first reply time for this conversation
-                if first_inbound_time and first_outbound_time:
-                    reply_time = first_outbound_time - first_inbound_time
-                    if reply_time > 0:  # Sanity check
-                        metrics["first_reply_times"].append(reply_time)
-                        metrics["conversations_with_reply"] += 1
-                
-                # Rate limit: 2 requests per second (within 5/sec burst limit)
-                await asyncio.sleep(0.5)
-                    
-            except httpx.HTTPStatusError:
-                # Skip this conversation if we can't fetch messages
-                continue
-            except Exception:
-                continue
-    
+
+        # Let the workers drain the queue
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+    finally:
+        for worker in workers:
+            worker.cancel()
+
+    if not metrics["total_conversations"]:
+        return f"No conversations found for team {team_id} in date range {start_date} to {end_date}"
+
     # Calculate averages
     avg_first_reply = 0
     if metrics["first_reply_times"]:
-        avg_first_reply = sum(metrics["first_reply_times"]) / len(metrics["first_reply_times"])
+        avg_first_reply = statistics.fmean(metrics["first_reply_times"])
     
     # Helper to format duration
     def format_duration(seconds):
@@ -3139,79 +3329,87 @@ async def calculate_team_metrics(
             return f"{hours}h {mins}m" if mins else f"{hours}h"
     
     # Build result
-    result = f"📊 Team Metrics Report\n\n"
-    result += f"📅 Period: {start_dt.strftime('%d %b %Y')} to {end_dt.strftime('%d %b %Y')}\n"
-    result += f"🏷️  Team ID: {team_id}\n\n"
-    
-    result += "═" * 45 + "\n"
-    result += "📧 OVERALL\n"
-    result += "═" * 45 + "\n"
-    result += f"  Conversations analysed:  {metrics['total_conversations']:,}\n"
-    result += f"  Messages received:       {metrics['total_inbound']:,}\n"
-    result += f"  Messages sent:           {metrics['total_outbound']:,}\n"
-    result += f"  Conversations replied:   {metrics['conversations_with_reply']:,}\n"
-    result += f"  First reply time (avg):  {format_duration(avg_first_reply)}\n\n"
+    parts = [
+        "📊 Team Metrics Report\n\n",
+        f"📅 Period: {format_date(start_dt)} to {format_date(end_dt)}\n",
+        f"🏷️  Team ID: {team_id}\n\n"
+    ]
+    
+    parts.append(_METRICS_HR)
+    parts.append("📧 OVERALL\n")
+    parts.append(_METRICS_HR)
+    parts.append(f"  Conversations analysed:  {metrics['total_conversations']:,}\n")
+    parts.append(f"  Messages received:       {metrics['total_inbound']:,}\n")
+    parts.append(f"  Messages sent:           {metrics['total_outbound']:,}\n")
+    parts.append(f"  Conversations replied:   {metrics['conversations_with_reply']:,}\n")
+    parts.append(f"  First reply time (avg):  {format_duration(avg_first_reply)}\n\n")
     
     # First reply time distribution
     if metrics["first_reply_times"]:
-        result += "═" * 45 + "\n"
-        result += "⏱️  FIRST REPLY TIME DISTRIBUTION\n"
-        result += "═" * 45 + "\n"
-        
-        times = metrics["first_reply_times"]
-        under_15m = sum(1 for t in times if t < 900)
-        under_1h = sum(1 for t in times if 900 <= t < 3600)
-        under_4h = sum(1 for t in times if 3600 <= t < 14400)
-        under_12h = sum(1 for t in times if 14400 <= t < 43200)
-        under_48h = sum(1 for t in times if 43200 <= t < 172800)
-        over_48h = sum(1 for t in times if t >= 172800)
+        parts.append(_METRICS_HR)
+        parts.append("⏱️  FIRST REPLY TIME DISTRIBUTION\n")
+        parts.append(_METRICS_HR)
+        
+        # Bucket counts are differences between bucket-edge positions in the
+        # sorted times
+        times = sorted(metrics["first_reply_times"])
+        edges = [bisect.bisect_left(times, edge) for edge in _REPLY_TIME_EDGES]
+        under_15m, under_1h, under_4h, under_12h, under_48h = (
+            high - low for low, high in zip([0] + edges, edges)
+        )
+        over_48h = len(times) - edges[-1]
         
         total = len(times)
-        result += f"  Under 15 min:  {under_15m:>5} ({under_15m*100//total}%)\n"
-        result += f"  15min - 1hr:   {under_1h:>5} ({under_1h*100//total}%)\n"
-        result += f"  1hr - 4hr:     {under_4h:>5} ({under_4h*100//total}%)\n"
-        result += f"  4hr - 12hr:    {under_12h:>5} ({under_12h*100//total}%)\n"
-        result += f"  12hr - 48hr:   {under_48h:>5} ({under_48h*100//total}%)\n"
-        result += f"  Over 48hr:     {over_48h:>5} ({over_48h*100//total}%)\n\n"
+        parts.append(f"  Under 15 min:  {under_15m:>5} ({under_15m*100//total}%)\n")
+        parts.append(f"  15min - 1hr:   {under_1h:>5} ({under_1h*100//total}%)\n")
+        parts.append(f"  1hr - 4hr:     {under_4h:>5} ({under_4h*100//total}%)\n")
+        parts.append(f"  4hr - 12hr:    {under_12h:>5} ({under_12h*100//total}%)\n")
+        parts.append(f"  12hr - 48hr:   {under_48h:>5} ({under_48h*100//total}%)\n")
+        parts.append(f"  Over 48hr:     {over_48h:>5} ({over_48h*100//total}%)\n\n")
     
     # Inbound by channel
     if metrics["channels_inbound"]:
-        result += "═" * 45 + "\n"
-        result += "📬 INBOUND BY CHANNEL\n"
-        result += "═" * 45 + "\n"
+        parts.append(_METRICS_HR)
+        parts.append("📬 INBOUND BY CHANNEL\n")
+        parts.append(_METRICS_HR)
         
         # Sort by count descending
-        sorted_channels = sorted(metrics["channels_inbound"].items(), 
-                                  key=lambda x: x[1], reverse=True)
+        sorted_channels = metrics["channels_inbound"].most_common()
         total_inbound = metrics["total_inbound"]
         
         for channel, count in sorted_channels:
             pct = (count * 100 // total_inbound) if total_inbound > 0 else 0
-            result += f"  {channel}: {count:,} ({pct}%)\n"
-        result += "\n"
+            parts.append(f"  {channel}: {count:,} ({pct}%)\n")
+        parts.append("\n")
     
     # Outbound by channel
     if metrics["channels_outbound"]:
-        result += "═" * 45 + "\n"
-        result += "📤 OUTBOUND BY CHANNEL\n"
-        result += "═" * 45 + "\n"
+        parts.append(_METRICS_HR)
+        parts.append("📤 OUTBOUND BY CHANNEL\n")
+        parts.append(_METRICS_HR)
         
-        sorted_channels = sorted(metrics["channels_outbound"].items(), 
-                                  key=lambda x: x[1], reverse=True)
+        sorted_channels = metrics["channels_outbound"].most_common()
         total_outbound = metrics["total_outbound"]
         
         for channel, count in sorted_channels:
             pct = (count * 100 // total_outbound) if total_outbound > 0 else 0
-            result += f"  {channel}: {count:,} ({pct}%)\n"
-        result += "\n"
+            parts.append(f"  {channel}: {count:,} ({pct}%)\n")
+        parts.append("\n")
     
     # Note about limitations
-    if len(conversations) >= max_conversations:
-        result += f"\n⚠️  Note: Limited to {max_conversations} conversations. Use max_conversations parameter for more.\n"
+    if metrics["total_conversations"] >= max_conversations:
+        parts.append(f"\n⚠️  Note: Limited to {max_conversations} conversations. Use max_conversations parameter for more.\n")
     
-    return result
+    return "".join(parts)
 
 
 # Run the server in stdio mode only (for Claude Desktop)
 if __name__ == "__main__":
+    # Use uvloop's faster event loop when installed (it is not available on Windows)
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
     mcp.run()